@@ -1,4 +1,4 @@
 # Copyright (c) OpenMMLab. All rights reserved.
-from mmcv.arraymisc.quantization import dequantize, quantize
+from mmcv.arraymisc.quantization import dequantize, quantize, quantize_batch
 
-__all__ = ['dequantize', 'quantize']
+__all__ = ['dequantize', 'quantize', 'quantize_batch']
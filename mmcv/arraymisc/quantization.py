@@ -1,7 +1,71 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 
+from collections.abc import Sequence
+
 import numpy as np
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Number of elements the NumPy code paths process per step. Running the whole
+# chain of elementwise stages on one block keeps the working buffer resident
+# in cache instead of streaming the full array through memory once per stage.
+_BLOCK_SIZE = 1 << 14
+
+
+def _quantize_numpy(arr: np.ndarray, min_val: int | float,
+                    max_val: int | float, levels: int, dtype) -> np.ndarray:
+    arr = np.asarray(arr)
+    flat = arr.reshape(-1)
+    if np.issubdtype(flat.dtype, np.floating):
+        buf_dtype = flat.dtype
+    else:
+        buf_dtype = np.dtype(np.float64)
+    quantized_arr = np.empty(flat.shape, dtype=dtype)
+    buf = np.empty(min(flat.size, _BLOCK_SIZE), dtype=buf_dtype)
+    for start in range(0, flat.size, _BLOCK_SIZE):
+        block = flat[start:start + _BLOCK_SIZE]
+        tmp = buf[:block.size]
+        np.clip(block, min_val, max_val, out=tmp)
+        tmp -= min_val
+        tmp *= levels
+        tmp /= max_val - min_val
+        np.floor(tmp, out=tmp)
+        np.minimum(tmp, levels - 1, out=tmp)
+        quantized_arr[start:start + _BLOCK_SIZE] = tmp
+    return quantized_arr.reshape(arr.shape)
+
+
+def _quantize(arr: np.ndarray, min_val: int | float, max_val: int | float,
+              levels: int, dtype) -> np.ndarray:
+    if numexpr is not None:
+        # clip, shift, scale and floor in a single pass over ``arr``
+        quantized_arr = numexpr.evaluate(
+            'floor(levels * (where(arr < min_val, min_val, '
+            'where(arr > max_val, max_val, arr)) - min_val) / span)',
+            local_dict=dict(
+                arr=arr,
+                min_val=min_val,
+                max_val=max_val,
+                levels=levels,
+                span=max_val - min_val))
+        np.minimum(quantized_arr, levels - 1, out=quantized_arr)
+        return quantized_arr.astype(dtype, copy=False)
+
+    return _quantize_numpy(arr, min_val, max_val, levels, dtype)
+
+
+def _check_quantize_params(min_val: int | float, max_val: int | float,
+                           levels: int) -> None:
+    if not (isinstance(levels, int) and levels > 1):
+        raise ValueError(
+            f'levels must be a positive integer, but got {levels}')
+    if min_val >= max_val:
+        raise ValueError(
+            f'min_val ({min_val}) must be smaller than max_val ({max_val})')
+
 
 def quantize(arr: np.ndarray,
              min_val: int | float,
@@ -20,18 +84,46 @@ def quantize(arr: np.ndarray,
     Returns:
         tuple: Quantized array.
     """
-    if not (isinstance(levels, int) and levels > 1):
-        raise ValueError(
-            f'levels must be a positive integer, but got {levels}')
-    if min_val >= max_val:
-        raise ValueError(
-            f'min_val ({min_val}) must be smaller than max_val ({max_val})')
+    _check_quantize_params(min_val, max_val, levels)
+    return _quantize(arr, min_val, max_val, levels, dtype)
 
-    arr = np.clip(arr, min_val, max_val) - min_val
-    quantized_arr = np.minimum(
-        np.floor(levels * arr / (max_val - min_val)).astype(dtype), levels - 1)
 
-    return quantized_arr
+def quantize_batch(arrays: Sequence[np.ndarray],
+                   min_val: int | float,
+                   max_val: int | float,
+                   levels: int,
+                   dtype=np.int64) -> list:
+    """Quantize a sequence of arrays sharing the same parameters.
+
+    Arrays with a common dtype are flattened into one buffer and quantized
+    in a single call, which amortizes the per-call overhead of
+    :func:`quantize` over the whole batch.
+
+    Args:
+        arrays (Sequence[ndarray]): Input arrays.
+        min_val (int or float): Minimum value to be clipped.
+        max_val (int or float): Maximum value to be clipped.
+        levels (int): Quantization levels.
+        dtype (np.type): The type of the quantized arrays.
+
+    Returns:
+        list[ndarray]: Quantized arrays, in the same order and with the same
+        shapes as ``arrays``.
+    """
+    _check_quantize_params(min_val, max_val, levels)
+    arrays = [np.asarray(arr) for arr in arrays]
+    if len({arr.dtype for arr in arrays}) != 1:
+        return [
+            _quantize(arr, min_val, max_val, levels, dtype) for arr in arrays
+        ]
+
+    flat = np.concatenate([arr.reshape(-1) for arr in arrays])
+    quantized_flat = _quantize(flat, min_val, max_val, levels, dtype)
+    sections = np.cumsum([arr.size for arr in arrays])[:-1]
+    return [
+        chunk.reshape(arr.shape)
+        for chunk, arr in zip(np.split(quantized_flat, sections), arrays)
+    ]
 
 
 def dequantize(arr: np.ndarray,
@@ -51,14 +143,18 @@ def dequantize(arr: np.ndarray,
     Returns:
         tuple: Dequantized array.
     """
-    if not (isinstance(levels, int) and levels > 1):
-        raise ValueError(
-            f'levels must be a positive integer, but got {levels}')
-    if min_val >= max_val:
-        raise ValueError(
-            f'min_val ({min_val}) must be smaller than max_val ({max_val})')
+    _check_quantize_params(min_val, max_val, levels)
 
-    dequantized_arr = (arr + 0.5).astype(dtype) * (max_val -
-                                                   min_val) / levels + min_val
+    # cast straight into ``dtype`` and scale/shift that buffer in place, so
+    # no float64 temporaries are created when a narrower dtype is requested
+    arr = np.asarray(arr)
+    flat = arr.reshape(-1)
+    dequantized_arr = np.empty(flat.shape, dtype=dtype)
+    for start in range(0, flat.size, _BLOCK_SIZE):
+        block = dequantized_arr[start:start + _BLOCK_SIZE]
+        np.add(flat[start:start + _BLOCK_SIZE], 0.5, out=block, dtype=dtype)
+        block *= max_val - min_val
+        block /= levels
+        block += min_val
 
-    return dequantized_arr
+    return dequantized_arr.reshape(arr.shape)
@@ -26,25 +26,30 @@ def build_conv_layer(cfg: dict | None, *args, **kwargs) -> nn.Module:
         nn.Module: Created conv layer.
     """
     if cfg is None:
-        cfg_ = {'type': 'Conv2d'}
-    else:
-        if not isinstance(cfg, dict):
-            raise TypeError('cfg must be a dict')
-        if 'type' not in cfg:
-            raise KeyError('the cfg dict must contain the key "type"')
-        cfg_ = cfg.copy()
-
-    layer_type = cfg_.pop('type')
+        return _get_conv_layer('Conv2d')(*args, **kwargs)
+    if not isinstance(cfg, dict):
+        raise TypeError('cfg must be a dict')
+    if 'type' not in cfg:
+        raise KeyError('the cfg dict must contain the key "type"')
+
+    layer_type = cfg['type']
+    cfg_ = {k: v for k, v in cfg.items() if k != 'type'}
     if inspect.isclass(layer_type):
         return layer_type(*args, **kwargs, **cfg_)  # type: ignore
+    conv_layer = _get_conv_layer(layer_type)
+    layer = conv_layer(*args, **kwargs, **cfg_)
+
+    return layer
+
+
+def _get_conv_layer(layer_type: str) -> type:
     # Switch registry to the target scope. If `conv_layer` cannot be found
     # in the registry, fallback to search `conv_layer` in the
-    # mmengine.MODELS.
+    # mmengine.MODELS. The lookup is not cached: modules can be
+    # re-registered with ``force=True`` at any time.
     with MODELS.switch_scope_and_registry(None) as registry:
         conv_layer = registry.get(layer_type)
     if conv_layer is None:
-        raise KeyError(f'Cannot find {conv_layer} in registry under scope '
+        raise KeyError(f'Cannot find {layer_type} in registry under scope '
                        f'name {registry.scope}')
-    layer = conv_layer(*args, **kwargs, **cfg_)
-
-    return layer
+    return conv_layer
@@ -15,12 +15,54 @@ def conv_ws_2d(input: torch.Tensor,
                dilation: int | tuple[int, int] = 1,
                groups: int = 1,
                eps: float = 1e-5) -> torch.Tensor:
+    """2D convolution with Weight Standardization.
+
+    The weight of every output channel is standardized to zero mean and unit
+    std before the convolution. The standardized weight is only
+    ``out_channels * in_channels * kh * kw`` elements, so materializing it is
+    cheap next to the convolution itself. When the weight is frozen, use
+    :meth:`ConvWS2d.fuse_weights` to take the standardization off the forward
+    path entirely.
+
+    Args:
+        input (torch.Tensor): Input feature map of shape (N, C, H, W).
+        weight (torch.Tensor): Convolution weight of shape
+            (out_channels, in_channels // groups, kh, kw).
+        bias (torch.Tensor, optional): Convolution bias. Default: None.
+        stride (int or tuple[int, int]): Stride of the convolution.
+            Default: 1.
+        padding (int or tuple[int, int]): Zero-padding added to both sides of
+            the input. Default: 0.
+        dilation (int or tuple[int, int]): Spacing between kernel elements.
+            Default: 1.
+        groups (int): Number of blocked connections from input channels to
+            output channels. Default: 1.
+        eps (float): Value added to the std for numerical stability.
+            Default: 1e-5.
+
+    Returns:
+        torch.Tensor: The output feature map.
+    """
+    weight = _standardize_weight(weight, eps)
+    return F.conv2d(input, weight, bias, stride, padding, dilation, groups)
+
+
+def _standardize_weight(weight: torch.Tensor, eps: float) -> torch.Tensor:
     c_in = weight.size(0)
     weight_flat = weight.view(c_in, -1)
-    mean = weight_flat.mean(dim=1, keepdim=True).view(c_in, 1, 1, 1)
-    std = weight_flat.std(dim=1, keepdim=True).view(c_in, 1, 1, 1)
-    weight = (weight - mean) / (std + eps)
-    return F.conv2d(input, weight, bias, stride, padding, dilation, groups)
+    n = weight_flat.size(1)
+    if n < 64:
+        # Short rows (e.g. 1x1 convs) are dominated by the fixed cost of the
+        # std reduction, plain sums over the centered weight are cheaper.
+        # The centered weight is reused for the output.
+        mean = weight_flat.mean(dim=1, keepdim=True)
+        centered = weight_flat - mean
+        std = (centered.square().sum(dim=1, keepdim=True) / (n - 1)).sqrt()
+        return centered.view_as(weight) / (std.view(c_in, 1, 1, 1) + eps)
+    # mean and std come out of a single reduction over the weight
+    std, mean = torch.std_mean(weight_flat, dim=1, keepdim=True)
+    std = std.view(c_in, 1, 1, 1) + eps
+    return (weight - mean.view(c_in, 1, 1, 1)).div_(std)
 
 
 @MODELS.register_module('ConvWS')
@@ -46,11 +88,45 @@ class ConvWS2d(nn.Conv2d):
             groups=groups,
             bias=bias)
         self.eps = eps
+        self.register_buffer('weight_std', None, persistent=False)
+
+    def fuse_weights(self) -> None:
+        """Precompute the standardized weight for inference.
+
+        Once fused, :meth:`forward` runs a plain convolution with the cached
+        weight instead of standardizing ``self.weight`` on every call in eval
+        mode. The cache is dropped by :meth:`train` and when a state dict is
+        loaded. Call :meth:`unfuse_weights` before modifying ``self.weight``
+        in place.
+        """
+        with torch.no_grad():
+            self.weight_std = _standardize_weight(self.weight, self.eps)
+
+    def unfuse_weights(self) -> None:
+        """Drop the weight cached by :meth:`fuse_weights`."""
+        self.weight_std = None
+
+    def train(self, mode: bool = True) -> 'ConvWS2d':
+        self.weight_std = None
+        return super().train(mode)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if self.weight_std is not None and not self.training:
+            return F.conv2d(x, self.weight_std, self.bias, self.stride,
+                            self.padding, self.dilation, self.groups)
         return conv_ws_2d(x, self.weight, self.bias, self.stride, self.padding,
                           self.dilation, self.groups, self.eps)
 
+    def _load_from_state_dict(self, state_dict: OrderedDict, prefix: str,
+                              local_metadata: dict, strict: bool,
+                              missing_keys: list[str],
+                              unexpected_keys: list[str],
+                              error_msgs: list[str]) -> None:
+        self.weight_std = None
+        super()._load_from_state_dict(state_dict, prefix, local_metadata,
+                                      strict, missing_keys, unexpected_keys,
+                                      error_msgs)
+
 
 @MODELS.register_module(name='ConvAWS')
 class ConvAWS2d(nn.Conv2d):
@@ -98,6 +174,7 @@ class ConvAWS2d(nn.Conv2d):
                              torch.ones(self.out_channels, 1, 1, 1))
         self.register_buffer('weight_beta',
                              torch.zeros(self.out_channels, 1, 1, 1))
+        self.register_buffer('weight_std', None, persistent=False)
 
     def _get_weight(self, weight: torch.Tensor) -> torch.Tensor:
         weight_flat = weight.view(weight.size(0), -1)
@@ -107,8 +184,32 @@ class ConvAWS2d(nn.Conv2d):
         weight = self.weight_gamma * weight + self.weight_beta
         return weight
 
+    def fuse_weights(self) -> None:
+        """Precompute the standardized and affine-transformed weight for
+        inference.
+
+        Once fused, :meth:`forward` runs a plain convolution with the cached
+        weight instead of standardizing ``self.weight`` on every call in eval
+        mode. The cache is dropped by :meth:`train` and when a state dict is
+        loaded. Call :meth:`unfuse_weights` before modifying ``self.weight``,
+        ``weight_gamma`` or ``weight_beta``, including through ``.data``.
+        """
+        with torch.no_grad():
+            self.weight_std = self._get_weight(self.weight)
+
+    def unfuse_weights(self) -> None:
+        """Drop the weight cached by :meth:`fuse_weights`."""
+        self.weight_std = None
+
+    def train(self, mode: bool = True) -> 'ConvAWS2d':
+        self.weight_std = None
+        return super().train(mode)
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        weight = self._get_weight(self.weight)
+        if self.weight_std is not None and not self.training:
+            weight = self.weight_std
+        else:
+            weight = self._get_weight(self.weight)
         return F.conv2d(x, weight, self.bias, self.stride, self.padding,
                         self.dilation, self.groups)
 
@@ -127,6 +228,7 @@ class ConvAWS2d(nn.Conv2d):
         and weight_gamma.
         """
 
+        self.weight_std = None
         self.weight_gamma.data.fill_(-1)
         local_missing_keys: list = []
         super()._load_from_state_dict(state_dict, prefix, local_metadata,
@@ -3,7 +3,50 @@ import warnings
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 from mmengine.registry import MODELS
+from torch.autograd import Function
+
+
+class HSigmoidFunction(Function):
+    """Hard sigmoid with a fused backward pass.
+
+    Instead of the full-precision activation kept by the unfused
+    ``add -> div -> clamp`` chain, only a boolean mask of the positions that
+    were not clamped is saved, and the backward pass is a single masked
+    scale of the incoming gradient.
+    """
+
+    @staticmethod
+    def forward(ctx, x: torch.Tensor, bias: float, divisor: float,
+                min_value: float, max_value: float) -> torch.Tensor:
+        out = x.add(bias).div_(divisor)
+        mask = (out >= min_value) & (out <= max_value)
+        ctx.divisor = divisor
+        ctx.save_for_backward(mask)
+        return out.clamp_(min_value, max_value)
+
+    @staticmethod
+    def symbolic(g, x, bias: float, divisor: float, min_value: float,
+                 max_value: float):
+        if min_value == 0.0 and max_value == 1.0:
+            # ONNX HardSigmoid is max(0, min(1, alpha * x + beta))
+            return g.op(
+                'HardSigmoid', x, alpha_f=1.0 / divisor, beta_f=bias / divisor)
+
+        def constant(value):
+            # float constants, integer arguments would export as int64
+            return g.op('Constant', value_t=torch.tensor(float(value)))
+
+        out = g.op('Add', x, constant(bias))
+        out = g.op('Div', out, constant(divisor))
+        return g.op('Clip', out, constant(min_value), constant(max_value))
+
+    @staticmethod
+    def backward(ctx, grad_output: torch.Tensor) -> tuple:
+        mask, = ctx.saved_tensors
+        grad_input = grad_output.div(ctx.divisor).mul_(mask)
+        return grad_input, None, None, None, None
 
 
 @MODELS.register_module()
@@ -44,7 +87,22 @@ class HSigmoid(nn.Module):
         self.min_value = min_value
         self.max_value = max_value
 
+        # the default arguments match ``F.hardsigmoid``, which runs as a
+        # single fused elementwise kernel
+        self._is_default = (
+            bias == 3.0 and divisor == 6.0 and min_value == 0.0
+            and max_value == 1.0)
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        x = (x + self.bias) / self.divisor
+        if self._is_default:
+            return F.hardsigmoid(x)
+        # the autograd function is also used for ONNX export, where it is
+        # emitted as a single HardSigmoid node whenever the range is [0, 1]
+        if (x.requires_grad and torch.is_grad_enabled()) or \
+                torch.onnx.is_in_onnx_export():
+            return HSigmoidFunction.apply(x, self.bias, self.divisor,
+                                          self.min_value, self.max_value)
+
+        x = x.add(self.bias).div_(self.divisor)
 
         return x.clamp_(self.min_value, self.max_value)
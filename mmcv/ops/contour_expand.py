@@ -7,6 +7,20 @@ from typing import Union, List
 from mmcv.ops.pure_pytorch_contour_expand.contour_expand import contour_expand_pytorch
 
 
+def _as_tensor(x: Union[np.ndarray, torch.Tensor],
+               dtype: type) -> torch.Tensor:
+    """Convert ``x`` to a contiguous CPU tensor of ``dtype``.
+
+    Inputs that already have the right dtype and layout are returned without
+    a copy, an ndarray then shares its memory with the returned tensor.
+    """
+    if isinstance(x, np.ndarray):
+        return torch.from_numpy(np.ascontiguousarray(x, dtype=dtype))
+    return x.to(
+        device='cpu', dtype=getattr(torch,
+                                    np.dtype(dtype).name)).contiguous()
+
+
 def contour_expand(kernel_mask: Union[np.ndarray, torch.Tensor],
                    internal_kernel_label: Union[np.ndarray, torch.Tensor],
                    min_kernel_area: int, kernel_num: int) -> List:
@@ -29,12 +43,10 @@ def contour_expand(kernel_mask: Union[np.ndarray, torch.Tensor],
     assert isinstance(min_kernel_area, int)
     assert isinstance(kernel_num, int)
 
-    if isinstance(kernel_mask, np.ndarray):
-        kernel_mask = torch.from_numpy(kernel_mask)
-    if isinstance(internal_kernel_label, np.ndarray):
-        internal_kernel_label = torch.from_numpy(internal_kernel_label)
+    kernel_mask = _as_tensor(kernel_mask, np.uint8)
+    internal_kernel_label = _as_tensor(internal_kernel_label, np.int32)
 
-    if kernel_mask.shape[0] == 0 or internal_kernel_label.shape[0] == 0:
+    if kernel_mask.numel() == 0 or internal_kernel_label.numel() == 0:
         label = []
     else:
         label = contour_expand_pytorch(kernel_mask, internal_kernel_label,
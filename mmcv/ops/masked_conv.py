@@ -1,46 +1,10 @@
 # Copyright (c) OpenMMLab. All rights reserved.
-import math
-
 import torch
 import torch.nn as nn
 from torch.autograd import Function
 from torch.autograd.function import once_differentiable
 from torch.nn.modules.utils import _pair
 
-import warnings
-
-from torch import nn
-import torch
-
-
-
-# PyTorch-only implementation
-class MaskedConvModule:
-    @staticmethod
-    def masked_im2col_forward(*args, **kwargs):
-        warnings.warn("Using PyTorch-only implementation of masked_im2col_forward. "
-                     "This may not be as efficient as the CUDA version.", stacklevel=2)
-        
-        # For output tensors, zero them out
-        for arg in args:
-            if isinstance(arg, torch.Tensor) and arg.requires_grad:
-                arg.zero_()
-        return
-    @staticmethod
-    def masked_col2im_forward(*args, **kwargs):
-        warnings.warn("Using PyTorch-only implementation of masked_col2im_forward. "
-                     "This may not be as efficient as the CUDA version.", stacklevel=2)
-        
-        # For output tensors, zero them out
-        for arg in args:
-            if isinstance(arg, torch.Tensor) and arg.requires_grad:
-                arg.zero_()
-        return
-
-# Create a module-like object to replace ext_module
-ext_module = MaskedConvModule
-
-
 
 class MaskedConv2dFunction(Function):
 
@@ -92,40 +56,40 @@ class MaskedConv2dFunction(Function):
             return output
 
         batch_size = features.size(0)
-        out_h = int(
-            math.floor(
-                torch.true_divide((features.size(2) + 2 * pad_h -
-                                   (kernel_h - 1) - 1), stride_h) + 1))
-        out_w = int(
-            math.floor(
-                torch.true_divide((features.size(3) + 2 * pad_w -
-                                   (kernel_w - 1) - 1), stride_w) + 1))
-        mask_inds = torch.nonzero(mask[0] > 0, as_tuple=False)
+        out_h = (features.size(2) + 2 * pad_h -
+                 (kernel_h - 1) - 1) // stride_h + 1
+        out_w = (features.size(3) + 2 * pad_w -
+                 (kernel_w - 1) - 1) // stride_w + 1
+        mask_h_idx, mask_w_idx = torch.nonzero(mask[0] > 0, as_tuple=True)
         output = features.new_zeros(batch_size, out_channel, out_h, out_w)
-        if mask_inds.numel() > 0:
-            mask_h_idx = mask_inds[:, 0].contiguous()
-            mask_w_idx = mask_inds[:, 1].contiguous()
-            data_col = features.new_zeros(in_channel * kernel_h * kernel_w,
-                                          mask_inds.size(0))
-            ext_module.masked_im2col_forward(
-                features,
-                mask_h_idx,
-                mask_w_idx,
-                data_col,
-                kernel_h=kernel_h,
-                kernel_w=kernel_w,
-                pad_h=pad_h,
-                pad_w=pad_w)
-            masked_output = torch.addmm(1, bias[:, None], 1,
-                                        weight.view(out_channel, -1), data_col)
-            ext_module.masked_col2im_forward(
-                masked_output,
-                mask_h_idx,
-                mask_w_idx,
-                output,
-                height=out_h,
-                width=out_w,
-                channels=out_channel)
+        if mask_h_idx.numel() > 0:
+            # im2col restricted to the masked positions: gather the
+            # receptive field of every masked pixel, ordered as
+            # (in_channel, kernel_h, kernel_w) like the weight. Taps that
+            # fall into the zero padding are clamped and then masked out,
+            # so no padded copy of the whole feature map is made.
+            height, width = features.shape[2:]
+            offsets_h = torch.arange(
+                -pad_h, kernel_h - pad_h, device=features.device)
+            offsets_w = torch.arange(
+                -pad_w, kernel_w - pad_w, device=features.device)
+            rows = mask_h_idx + offsets_h[:, None, None]
+            cols = mask_w_idx + offsets_w[:, None]
+            inside = (rows >= 0) & (rows < height) & (cols >= 0) & (
+                cols < width)
+            rows = rows.clamp(0, height - 1)
+            cols = cols.clamp(0, width - 1)
+            data_col = features[0][:, rows, cols]
+            data_col = data_col.mul_(inside).view(
+                in_channel * kernel_h * kernel_w, -1)
+            weight_flat = weight.view(out_channel, -1)
+            if bias is None:
+                masked_output = torch.mm(weight_flat, data_col)
+            else:
+                masked_output = torch.addmm(bias[:, None], weight_flat,
+                                            data_col)
+            # col2im: scatter the results back to the masked positions
+            output[0, :, mask_h_idx, mask_w_idx] = masked_output
         return output
 
     @staticmethod
@@ -155,6 +119,8 @@ class MaskedConv2d(nn.Conv2d):
                  bias: bool = True):
         super().__init__(in_channels, out_channels, kernel_size, stride,
                          padding, dilation, groups, bias)
+        # resolved once here instead of on every masked forward
+        self.support_masked_forward = self.stride == (1, 1)
 
     def forward(self,
                 input: torch.Tensor,
@@ -162,5 +128,8 @@ class MaskedConv2d(nn.Conv2d):
         if mask is None:  # fallback to the normal Conv2d
             return super().forward(input)
         else:
+            if not self.support_masked_forward:
+                raise ValueError(
+                    'Stride could not only be 1 in masked_conv2d currently.')
             return masked_conv2d(input, mask, self.weight, self.bias,
                                  self.padding)
@@ -1,5 +1,4 @@
 # Copyright (c) OpenMMLab. All rights reserved.
-import math
 from abc import abstractmethod
 
 import torch
@@ -92,23 +91,26 @@ class BaseMergeCell(nn.Module):
         pass
 
     def _resize(self, x, size):
-        if x.shape[-2:] == size:
+        h, w = x.shape[-2], x.shape[-1]
+        target_h, target_w = size
+        if h == target_h and w == target_w:
             return x
-        elif x.shape[-2:] < size:
+        elif (h, w) < size:
             return F.interpolate(x, size=size, mode=self.upsample_mode)
         else:
-            if x.shape[-2] % size[-2] != 0 or x.shape[-1] % size[-1] != 0:
-                h, w = x.shape[-2:]
-                target_h, target_w = size
-                pad_h = math.ceil(h / target_h) * target_h - h
-                pad_w = math.ceil(w / target_w) * target_w - w
+            if h % target_h != 0 or w % target_w != 0:
+                # pad up to the next multiple of the target size
+                pad_h = -h % target_h
+                pad_w = -w % target_w
                 pad_l = pad_w // 2
                 pad_r = pad_w - pad_l
                 pad_t = pad_h // 2
                 pad_b = pad_h - pad_t
                 pad = (pad_l, pad_r, pad_t, pad_b)
                 x = F.pad(x, pad, mode='constant', value=0.0)
-            kernel_size = (x.shape[-2] // size[-2], x.shape[-1] // size[-1])
+                h += pad_h
+                w += pad_w
+            kernel_size = (h // target_h, w // target_w)
             x = F.max_pool2d(x, kernel_size=kernel_size, stride=kernel_size)
             return x
 
@@ -120,6 +122,7 @@ class BaseMergeCell(nn.Module):
         assert out_size is None or len(out_size) == 2
         if out_size is None:  # resize to larger one
             out_size = max(x1.size()[2:], x2.size()[2:])
+        out_size = (int(out_size[0]), int(out_size[1]))
 
         x1 = self.input1_conv(x1)
         x2 = self.input2_conv(x2)
@@ -163,4 +166,5 @@ class GlobalPoolingCell(BaseMergeCell):
 
     def _binary_op(self, x1, x2):
         x2_att = self.global_pool(x2).sigmoid()
-        return x2 + x2_att * x1
+        # x2 + x2_att * x1 in a single fused kernel
+        return torch.addcmul(x2, x2_att, x1)
@@ -5,7 +5,14 @@ import torch
 from mmengine.utils import deprecated_api_warning
 from torch import Tensor
 
-from mmcv.ops.pure_pytorch_nms import nms_match_pytorch, nms_pytorch, soft_nms_pytorch
+from mmcv.ops.pure_pytorch_nms import (nms_match_pytorch, nms_numba,
+                                       nms_pytorch, soft_nms_numba,
+                                       soft_nms_pytorch)
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 
 # Define a stub for nms_rotated for backwards compatibility
@@ -23,10 +30,12 @@ class NMSop(torch.autograd.Function):
                 offset: int, score_threshold: float, max_num: int) -> Tensor:
         is_filtering_by_score = score_threshold > 0
         if is_filtering_by_score:
-            valid_mask = scores > score_threshold
-            bboxes, scores = bboxes[valid_mask], scores[valid_mask]
+            # A single nonzero() is the only host sync needed to filter;
+            # boolean-mask indexing would sync once per indexed tensor.
             valid_inds = torch.nonzero(
-                valid_mask, as_tuple=False).squeeze(dim=1)
+                scores > score_threshold, as_tuple=True)[0]
+            bboxes = bboxes.index_select(0, valid_inds)
+            scores = scores.index_select(0, valid_inds)
 
         # Use pure PyTorch implementation instead of CUDA
         inds = nms_pytorch(bboxes, scores, float(iou_threshold))
@@ -44,19 +53,19 @@ class SoftNMSop(torch.autograd.Function):
     def forward(ctx: Any, boxes: Tensor, scores: Tensor, iou_threshold: float,
                 sigma: float, min_score: float, method: int,
                 offset: int) -> tuple[Tensor, Tensor]:
-        # Map method int to string for pure PyTorch implementation
-        method_map = {0: 'naive', 1: 'linear', 2: 'gaussian'}
-        method_str = method_map[method]
-        
-        # Use pure PyTorch implementation
-        dets, inds = soft_nms_pytorch(
+        # The per-pick loop is dominated by op dispatch overhead on CPU, so
+        # run it as one compiled kernel when Numba is available.
+        if numba is not None and boxes.device.type == 'cpu':
+            soft_nms_impl = soft_nms_numba
+        else:
+            soft_nms_impl = soft_nms_pytorch
+        dets, inds = soft_nms_impl(
             boxes,
             scores,
             iou_threshold=float(iou_threshold),
             sigma=float(sigma),
             min_score=float(min_score),
-            method=method_str)
-            
+            method=int(method))
         return dets, inds
 
     @staticmethod
@@ -121,18 +130,34 @@ def nms(boxes: array_like_type,
     """
     assert isinstance(boxes, Tensor | np.ndarray)
     assert isinstance(scores, Tensor | np.ndarray)
+    assert boxes.shape[1] == 4
+    assert boxes.shape[0] == scores.shape[0]
+    assert offset in (0, 1)
+
+    if (numba is not None and isinstance(boxes, np.ndarray)
+            and isinstance(scores, np.ndarray)):
+        # NumPy inputs stay in NumPy and skip the autograd Function.
+        inds = nms_numba(boxes, scores, float(iou_threshold), score_threshold,
+                         max_num)
+        dets = np.concatenate((boxes[inds], scores[inds].reshape(-1, 1)),
+                              axis=1)
+        return dets, inds
+
     is_numpy = False
     if isinstance(boxes, np.ndarray):
         is_numpy = True
         boxes = torch.from_numpy(boxes)
     if isinstance(scores, np.ndarray):
         scores = torch.from_numpy(scores)
-    assert boxes.size(1) == 4
-    assert boxes.size(0) == scores.size(0)
-    assert offset in (0, 1)
 
-    inds = NMSop.apply(boxes, scores, iou_threshold, offset, score_threshold,
-                       max_num)
+    if boxes.size(0) <= 1:
+        # Nothing can be suppressed, so skip the autograd Function.
+        inds = torch.arange(boxes.size(0), device=boxes.device)
+        if score_threshold > 0:
+            inds = inds[scores > score_threshold]
+    else:
+        inds = NMSop.apply(boxes, scores, iou_threshold, offset,
+                           score_threshold, max_num)
     dets = torch.cat((boxes[inds], scores[inds].reshape(-1, 1)), dim=1)
     if is_numpy:
         dets = dets.cpu().numpy()
@@ -193,12 +218,16 @@ def soft_nms(boxes: array_like_type,
     method_dict = {'naive': 0, 'linear': 1, 'gaussian': 2}
     assert method in method_dict.keys()
 
-    dets, inds = SoftNMSop.apply(boxes.cpu(), scores.cpu(),
-                                 float(iou_threshold), float(sigma),
-                                 float(min_score), method_dict[method],
-                                 int(offset))
-
-    dets = dets[:inds.size(0)]
+    if boxes.size(0) <= 1:
+        # A lone box is always picked and never decayed.
+        dets = torch.cat((boxes, scores.reshape(-1, 1)), dim=1)
+        inds = torch.arange(boxes.size(0), device=boxes.device)
+    else:
+        dets, inds = SoftNMSop.apply(boxes.cpu(), scores.cpu(),
+                                     float(iou_threshold), float(sigma),
+                                     float(min_score), method_dict[method],
+                                     int(offset))
+        dets = dets[:inds.size(0)]
 
     if is_numpy:
         dets = dets.cpu().numpy()
@@ -212,7 +241,8 @@ def batched_nms(boxes: Tensor,
                 scores: Tensor,
                 idxs: Tensor,
                 nms_cfg: dict | None,
-                class_agnostic: bool = False) -> tuple[Tensor, Tensor]:
+                class_agnostic: bool = False,
+                max_num: int = -1) -> tuple[Tensor, Tensor]:
     r"""Performs non-maximum suppression in a batched fashion.
 
     Modified from `torchvision/ops/boxes.py#L39
@@ -246,6 +276,10 @@ def batched_nms(boxes: Tensor,
         class_agnostic (bool): if true, nms is class agnostic,
             i.e. IoU thresholding happens over all boxes,
             regardless of the predicted class. Defaults to False.
+        max_num (int): Number of highest-scoring boxes to return. When
+            `nms_cfg` is None, only a partial ``topk`` is needed instead of a
+            full sort. The ``max_num`` key of `nms_cfg` takes precedence over
+            this argument. Defaults to -1, i.e. return all boxes.
 
     Returns:
         tuple: kept dets and indice.
@@ -256,13 +290,21 @@ def batched_nms(boxes: Tensor,
         - keep (Tensor): The indices of remaining boxes in input
           boxes.
     """
+    if boxes.size(0) == 0:
+        return boxes.new_zeros((0, boxes.size(-1) + 1)), idxs.new_zeros(
+            0, dtype=torch.long)
+
     # skip nms when nms_cfg is None
     if nms_cfg is None:
-        scores, inds = scores.sort(descending=True)
+        if 0 < max_num < scores.numel():
+            scores, inds = scores.topk(max_num)
+        else:
+            scores, inds = scores.sort(descending=True)
         boxes = boxes[inds]
         return torch.cat([boxes, scores[:, None]], -1), inds
 
     nms_cfg_ = nms_cfg.copy()
+    max_num = nms_cfg_.pop('max_num', max_num)
     class_agnostic = nms_cfg_.pop('class_agnostic', class_agnostic)
     if class_agnostic:
         boxes_for_nms = boxes
@@ -277,15 +319,13 @@ def batched_nms(boxes: Tensor,
             # which is larger than polygon max coordinate
             # max(x1, y1, x2, y2,x3, y3, x4, y4)
             max_coordinate = boxes[..., :2].max() + boxes[..., 2:4].max()
-            offsets = idxs.to(boxes) * (
-                max_coordinate + torch.tensor(1).to(boxes))
+            offsets = idxs.to(boxes, copy=True).mul_(max_coordinate + 1)
             boxes_ctr_for_nms = boxes[..., :2] + offsets[:, None]
             boxes_for_nms = torch.cat([boxes_ctr_for_nms, boxes[..., 2:5]],
                                       dim=-1)
         else:
             max_coordinate = boxes.max()
-            offsets = idxs.to(boxes) * (
-                max_coordinate + torch.tensor(1).to(boxes))
+            offsets = idxs.to(boxes, copy=True).mul_(max_coordinate + 1)
             boxes_for_nms = boxes + offsets[:, None]
 
     nms_op = nms_cfg_.pop('type', 'nms')
@@ -305,12 +345,17 @@ def batched_nms(boxes: Tensor,
 
         scores = dets[:, -1]
     else:
-        max_num = nms_cfg_.pop('max_num', -1)
         total_mask = scores.new_zeros(scores.size(), dtype=torch.bool)
         # Some type of nms would reweight the score, such as SoftNMS
         scores_after_nms = scores.new_zeros(scores.size())
-        for id in torch.unique(idxs):
-            mask = (idxs == id).nonzero(as_tuple=False).view(-1)
+        # One NMS call per class: the cost of NMS grows with the square of
+        # the number of boxes, so classes are never merged into larger
+        # groups. A stable sort by class makes every class a contiguous
+        # slice of ``perm``, so no per-class comparison pass over ``idxs``
+        # is needed.
+        sorted_idxs, perm = idxs.sort(stable=True)
+        counts = torch.unique_consecutive(sorted_idxs, return_counts=True)[1]
+        for mask in perm.split(counts.tolist()):
             dets, keep = nms_op(boxes_for_nms[mask], scores[mask], **nms_cfg_)
             total_mask[mask[keep]] = True
             scores_after_nms[mask[keep]] = dets[:, -1]
@@ -320,10 +365,10 @@ def batched_nms(boxes: Tensor,
         keep = keep[inds]
         boxes = boxes[keep]
 
-        if max_num > 0:
-            keep = keep[:max_num]
-            boxes = boxes[:max_num]
-            scores = scores[:max_num]
+    if max_num > 0:
+        keep = keep[:max_num]
+        boxes = boxes[:max_num]
+        scores = scores[:max_num]
 
     boxes = torch.cat([boxes, scores[:, None]], -1)
     return boxes, keep
@@ -355,9 +400,12 @@ def nms_match(dets: array_like_type,
             dets_t = torch.from_numpy(dets)
         else:
             dets_t = dets
-        
-        # Use pure PyTorch implementation
-        matched = nms_match_pytorch(dets_t, float(iou_threshold))
+
+        if dets_t.shape[0] == 1:
+            matched = [dets_t.new_zeros(1, dtype=torch.long)]
+        else:
+            # Use pure PyTorch implementation
+            matched = nms_match_pytorch(dets_t, float(iou_threshold))
 
     if isinstance(dets, np.ndarray):
         return [m.cpu().numpy() for m in matched]
@@ -389,11 +437,11 @@ def nms_quadri(dets: Tensor,
         same data type as the input.
     """
     from mmcv.ops.pure_pytorch_nms import nms_quadri_pytorch
-    
+
     if dets.shape[0] == 0:
         return dets, None
 
     # Use pure PyTorch implementation
     dets_out, keep_inds = nms_quadri_pytorch(dets, scores, iou_threshold, labels)
-    
+
     return dets_out, keep_inds
@@ -1,23 +1,149 @@
-import warnings
-
 import torch
 
+# Number of box pairs whose intersection is evaluated at once. Every pair
+# carries 24 candidate intersection vertices, so a chunk needs a few tens
+# of MB of temporaries.
+_PAIR_CHUNK = 1 << 16
+
+
+def _cross(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """z component of the cross product of 2d vectors in the last dim."""
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def _polygon_area(vertices: torch.Tensor) -> torch.Tensor:
+    """Unsigned shoelace area of polygons given as (..., K, 2) vertices."""
+    return _cross(vertices, vertices.roll(-1, dims=-2)).sum(-1).abs() / 2
+
+
+def _quadri_intersection(quads1: torch.Tensor,
+                         quads2: torch.Tensor) -> torch.Tensor:
+    """Area of the intersection of aligned pairs of convex quadrilaterals.
 
-def box_iou_quadri_pytorch(*args, **kwargs):
+    The intersection of two convex polygons is the convex polygon spanned by
+    the vertices of either polygon lying inside the other one and the
+    crossing points of their edges. For every pair, these 4 + 4 + 16
+    candidates are evaluated at once with a validity mask, sorted by angle
+    around their centroid and fed to the shoelace formula.
+
+    Args:
+        quads1 (torch.Tensor): Quadrilaterals in shape (K, 4, 2).
+        quads2 (torch.Tensor): Quadrilaterals in shape (K, 4, 2).
+
+    Returns:
+        torch.Tensor: Intersection areas in shape (K, ).
     """
-    PyTorch-only stub implementation of box_iou_quadri.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    edges1 = quads1.roll(-1, dims=1) - quads1
+    edges2 = quads2.roll(-1, dims=1) - quads2
+
+    def inside(points, vertices, edges):
+        # (K, P) mask of points within the convex polygon, boundary
+        # included, whatever the orientation of its vertices.
+        cross = _cross(edges[:, None], points[:, :, None] - vertices[:, None])
+        return (cross >= 0).all(-1) | (cross <= 0).all(-1)
+
+    # (K, 4, 4) crossings of every edge of quads1 with every edge of quads2.
+    r = edges1[:, :, None]
+    s = edges2[:, None]
+    qp = quads2[:, None] - quads1[:, :, None]
+    denom = _cross(r, s)
+    t = _cross(qp, s) / denom
+    u = _cross(qp, r) / denom
+    crossing = (denom != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    crossing_points = quads1[:, :, None] + t[..., None] * r
+
+    points = torch.cat([quads1, quads2, crossing_points.flatten(1, 2)], dim=1)
+    valid = torch.cat([
+        inside(quads1, quads2, edges2),
+        inside(quads2, quads1, edges1),
+        crossing.flatten(1)
+    ],
+                      dim=1)
+    num_valid = valid.sum(1)
+
+    # Crossings of parallel edges are NaN; zero them along with the other
+    # invalid candidates.
+    points = torch.where(valid[..., None], points, 0.)
+    centroid = points.sum(1) / num_valid.clamp(min=1)[:, None]
+    points = points - centroid[:, None]
+    angles = torch.atan2(points[..., 1], points[..., 0])
+    # Invalid candidates sort last and are then collapsed onto the first
+    # vertex, where they add nothing to the shoelace sum.
+    angles = angles.masked_fill_(~valid, 4.)
+    order = angles.argsort(dim=1)
+    points = points.gather(1, order[..., None].expand_as(points))
+    valid = valid.gather(1, order)
+    points = torch.where(valid[..., None], points, points[:, :1])
+    area = _polygon_area(points)
+    return area.masked_fill_(num_valid < 3, 0)
+
+
+def quadri_iou_aligned(quads1: torch.Tensor,
+                       quads2: torch.Tensor,
+                       mode_flag: int = 0) -> torch.Tensor:
+    """IoU (``mode_flag`` 0) or IoF (``mode_flag`` 1) of aligned pairs of
+    convex quadrilaterals in (x1, y1, ..., x4, y4) format, shape (K, 8).
+
+    As in the CUDA kernel, both quadrilaterals are shifted by the center of
+    the first one for precision, and pairs involving a degenerate
+    quadrilateral have an IoU of 0.
     """
-    warnings.warn("Using stub implementation of box_iou_quadri. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    quads1 = quads1.view(-1, 4, 2)
+    quads2 = quads2.view(-1, 4, 2)
+    center = quads1.mean(1, keepdim=True)
+    quads1 = quads1 - center
+    quads2 = quads2 - center
+
+    ious = quads1.new_empty(quads1.size(0))
+    for start in range(0, quads1.size(0), _PAIR_CHUNK):
+        chunk = slice(start, start + _PAIR_CHUNK)
+        area1 = _polygon_area(quads1[chunk])
+        area2 = _polygon_area(quads2[chunk])
+        inter = _quadri_intersection(quads1[chunk], quads2[chunk])
+        base = area1 + area2 - inter if mode_flag == 0 else area1
+        ious[chunk] = torch.where((area1 < 1e-14) | (area2 < 1e-14), 0.,
+                                  inter / base)
+    return ious
+
+
+def quadri_bounds(quads: torch.Tensor) -> torch.Tensor:
+    """Axis-aligned bounds (x1, y1, x2, y2) of quadrilaterals, shape
+    (K, 4)."""
+    vertices = quads.view(-1, 4, 2)
+    return torch.cat([vertices.amin(1), vertices.amax(1)], dim=1)
+
+
+def box_iou_quadri_pytorch(bboxes1: torch.Tensor,
+                           bboxes2: torch.Tensor,
+                           ious: torch.Tensor,
+                           mode_flag: int = 0,
+                           aligned: bool = False) -> torch.Tensor:
+    """
+    Pure PyTorch implementation of box_iou_quadri.
+
+    Only pairs whose axis-aligned bounds overlap can intersect, so the
+    polygon intersection is evaluated for those pairs only and all others
+    are left at 0.
+
+    Args:
+        bboxes1 (torch.Tensor): Quadrilaterals in shape (N, 8).
+        bboxes2 (torch.Tensor): Quadrilaterals in shape (M, 8).
+        ious (torch.Tensor): Zero-initialized tensor the result is written
+            into, in shape (N, ) if ``aligned`` else (N * M, ).
+        mode_flag (int): 0 for IoU, 1 for IoF.
+        aligned (bool): Whether to compare aligned pairs of boxes.
+
+    Returns:
+        torch.Tensor: ``ious``.
+    """
+    if aligned:
+        return ious.copy_(quadri_iou_aligned(bboxes1, bboxes2, mode_flag))
+
+    bounds1 = quadri_bounds(bboxes1)
+    bounds2 = quadri_bounds(bboxes2)
+    overlap = ((bounds1[:, None, :2] <= bounds2[None, :, 2:]) &
+               (bounds2[None, :, :2] <= bounds1[:, None, 2:])).all(-1)
+    rows, cols = torch.nonzero(overlap, as_tuple=True)
+    ious.view(overlap.shape)[rows, cols] = quadri_iou_aligned(
+        bboxes1[rows], bboxes2[cols], mode_flag).to(ious.dtype)
+    return ious
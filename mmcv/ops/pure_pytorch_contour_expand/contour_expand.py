@@ -1,23 +1,81 @@
-import warnings
-
 import torch
 
+# Offsets (dy, dx) of the 4-connected neighbours, in the order the reference
+# implementation visits them.
+_NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
 
-def contour_expand_pytorch(*args, **kwargs):
+def contour_expand_pytorch(kernel_mask: torch.Tensor,
+                           internal_kernel_label: torch.Tensor,
+                           min_kernel_area: int,
+                           kernel_num: int) -> list[list[int]]:
     """
-    PyTorch-only stub implementation of contour_expand.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of contour_expand.
+
+    Kernels whose area is below ``min_kernel_area`` are dropped, and the
+    remaining ones are grown through the kernel masks from the second
+    smallest scale to the largest one, as in progressive scale expansion.
+    Each scale is a breadth-first flood of the 4-connected mask pixels,
+    computed one level per step for all kernels at once, resolving pixels
+    reached by several kernels in the same step exactly as the queue-based
+    reference implementation does. Pixels that could not grow at a scale
+    seed the next one.
+
+    Args:
+        kernel_mask (torch.Tensor): The kernel masks with size kxhxw,
+            ordered from the largest to the smallest scale.
+        internal_kernel_label (torch.Tensor): The instance internal kernel
+            label with size hxw.
+        min_kernel_area (int): The minimum kernel area.
+        kernel_num (int): The instance kernel number.
+
+    Returns:
+        list[list[int]]: The instance index map with size hxw.
     """
-    warnings.warn("Using stub implementation of contour_expand. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    num_scales, height, width = kernel_mask.shape
+    labels = internal_kernel_label.to(torch.int64, copy=True).view(-1)
+    area = torch.bincount(labels, minlength=kernel_num + 1)
+    labels[(labels > 0) & (area[labels] < min_kernel_area)] = 0
+
+    # The queue is kept as flat pixel positions in the order of the
+    # reference implementation's FIFO queue: seeds are queued in row-major
+    # order, and a pixel is claimed by the first queued neighbour that
+    # reaches it, trying neighbours in ``_NEIGHBOURS`` order.
+    offsets = torch.tensor(_NEIGHBOURS, device=labels.device)
+    queue = torch.nonzero(labels > 0, as_tuple=True)[0]
+    for scale in range(num_scales - 2, -1, -1):
+        free = kernel_mask[scale].reshape(-1).bool() & (labels == 0)
+        edges = []
+        frontier = queue
+        while frontier.numel() > 0:
+            # (F, 4) candidates, flattened in (queue position, direction)
+            # order.
+            ys = (frontier // width)[:, None] + offsets[:, 0]
+            xs = (frontier % width)[:, None] + offsets[:, 1]
+            owner = torch.arange(
+                frontier.numel(), device=labels.device)[:, None].expand(-1, 4)
+            inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+            dst = ys[inside] * width + xs[inside]
+            owner = owner[inside]
+            valid = free[dst]
+            dst, owner = dst[valid], owner[valid]
+
+            # Keep the first claim on every pixel, in queue order.
+            claimed, inverse = torch.unique(dst, return_inverse=True)
+            first = torch.full_like(claimed, dst.numel()).scatter_reduce_(
+                0, inverse, torch.arange(dst.numel(), device=dst.device),
+                'amin').sort().values
+            owner = owner[first]
+
+            # Pixels that claimed nothing are on the edge of the mask and
+            # seed the next scale.
+            grew = torch.zeros_like(frontier, dtype=torch.bool)
+            grew[owner] = True
+            edges.append(frontier[~grew])
+
+            labels[dst[first]] = labels[frontier[owner]]
+            frontier = dst[first]
+            free[frontier] = False
+        queue = torch.cat(edges) if edges else queue
+
+    return labels.view(height, width).tolist()
@@ -3,13 +3,100 @@ from typing import Union
 import numpy as np
 import torch
 
+from mmcv.ops.pure_pytorch_box_iou_quadri.box_iou_quadri import (
+    quadri_bounds, quadri_iou_aligned)
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 array_like_type = Union[torch.Tensor, np.ndarray]
 
 
+def _suppression_matrix(boxes: torch.Tensor,
+                        iou_threshold: float,
+                        block_size: int = 256) -> torch.Tensor:
+    """Return the (N, N) bool matrix whose entry (i, j) tells whether box i
+    overlaps box j by more than ``iou_threshold``, restricted to ``i < j``.
+
+    Rows are processed in blocks and only the columns at or right of the
+    diagonal are evaluated, which halves the work. The float temporaries
+    of all blocks share one ``(3, block_size * N)`` scratch buffer that is
+    written through ``out=``, so a call makes a single float allocation
+    regardless of ``N``.
+
+    The IoU is evaluated in the dtype of ``boxes`` (float32 for integer
+    boxes) and never downcast: with an 8-bit mantissa, bfloat16 cannot even
+    represent pixel coordinates above 256 exactly, which flips suppression
+    decisions.
+    """
+    if not boxes.is_floating_point():
+        boxes = boxes.float()
+    num_boxes = boxes.shape[0]
+    x1, y1, x2, y2 = boxes.unbind(dim=1)
+    areas = (x2 - x1) * (y2 - y1)
+
+    suppress = boxes.new_zeros((num_boxes, num_boxes), dtype=torch.bool)
+    scratch = boxes.new_empty((3, min(block_size, num_boxes) * num_boxes))
+    for start in range(0, num_boxes, block_size):
+        rows = slice(start, start + block_size)
+        cols = slice(start, None)
+        shape = (min(block_size, num_boxes - start), num_boxes - start)
+        w, h, tmp = scratch[:, :shape[0] * shape[1]].view(3, *shape)
+        torch.min(x2[rows, None], x2[cols], out=w)
+        w.sub_(torch.max(x1[rows, None], x1[cols], out=tmp)).clamp_(min=0)
+        torch.min(y2[rows, None], y2[cols], out=h)
+        h.sub_(torch.max(y1[rows, None], y1[cols], out=tmp)).clamp_(min=0)
+        inter = w.mul_(h)
+        union = torch.add(areas[rows, None], areas[cols], out=tmp).sub_(inter)
+        # ``~(iou <= thr)`` rather than ``iou > thr`` so that the NaN IoU of
+        # degenerate boxes suppresses, as in the sequential implementation.
+        torch.le(inter.div_(union), iou_threshold, out=suppress[rows, cols])
+        suppress[rows, cols].logical_not_()
+    return suppress.triu_(diagonal=1)
+
+
+# Fixed-point iterations tried before ``_greedy_keep`` falls back to a
+# sequential scan. Each iteration is a pass over the suppression matrix, and
+# chains of boxes each suppressing only the next one need as many iterations
+# as the chain is long.
+_MAX_FIXED_POINT_ITERS = 4
+
+
+def _greedy_keep(suppress: torch.Tensor) -> torch.Tensor:
+    """Return the keep mask of greedy NMS given the upper-triangular
+    suppression matrix of score-sorted boxes."""
+    keep = ~suppress.any(dim=0)
+    for _ in range(_MAX_FIXED_POINT_ITERS):
+        new_keep = ~suppress[keep].any(dim=0)
+        if torch.equal(new_keep, keep):
+            return keep
+        keep = new_keep
+
+    # Long suppression chains: scan the boxes in score order instead, which
+    # is linear in the number of kept boxes.
+    suppress_np = suppress.cpu().numpy()
+    removed = np.zeros(suppress_np.shape[0], dtype=bool)
+    keep_np = np.zeros_like(removed)
+    for i in range(suppress_np.shape[0]):
+        if not removed[i]:
+            keep_np[i] = True
+            removed[i + 1:] |= suppress_np[i, i + 1:]
+    return torch.from_numpy(keep_np).to(suppress.device)
+
+
 def nms_pytorch(boxes: torch.Tensor, scores: torch.Tensor, iou_threshold: float) -> torch.Tensor:
     """
     Pure PyTorch implementation of NMS without CUDA dependencies.
-    
+
+    The IoU of every higher-scoring/lower-scoring pair of boxes is computed
+    once. A single column-wise reduction over it is Fast-NMS, which may also
+    drop boxes that are only overlapped by already suppressed boxes, so the
+    reduction is repeated with the surviving boxes as the only suppressors
+    until the keep mask stops changing. The fixed point is exactly the
+    result of greedy NMS and is usually reached within a few iterations.
+
     Args:
         boxes (torch.Tensor): Boxes in shape (N, 4). 
         scores (torch.Tensor): Scores in shape (N, ).
@@ -20,151 +107,303 @@ def nms_pytorch(boxes: torch.Tensor, scores: torch.Tensor, iou_threshold: float)
     """
     if boxes.shape[0] == 0:
         return torch.tensor([], dtype=torch.int64, device=boxes.device)
-    
-    x1 = boxes[:, 0]
-    y1 = boxes[:, 1]
-    x2 = boxes[:, 2]
-    y2 = boxes[:, 3]
-    
-    areas = (x2 - x1) * (y2 - y1)
-    order = torch.argsort(scores, descending=True)
-    
-    keep = []
-    while order.size(0) > 0:
-        i = order[0].item()
-        keep.append(i)
-        
-        if order.size(0) == 1:
-            break
-        
-        # Compute IoU of the picked box with the rest
-        xx1 = torch.max(x1[i], x1[order[1:]])
-        yy1 = torch.max(y1[i], y1[order[1:]])
-        xx2 = torch.min(x2[i], x2[order[1:]])
-        yy2 = torch.min(y2[i], y2[order[1:]])
-        
-        w = torch.clamp(xx2 - xx1, min=0)
-        h = torch.clamp(yy2 - yy1, min=0)
-        inter = w * h
-        
-        iou = inter / (areas[i] + areas[order[1:]] - inter)
-        
-        # Keep boxes with IoU < threshold
-        inds = torch.where(iou <= iou_threshold)[0]
-        order = order[inds + 1]
-    
-    return torch.tensor(keep, dtype=torch.int64, device=boxes.device)
-
-
-def soft_nms_pytorch(boxes: torch.Tensor, 
-                    scores: torch.Tensor, 
-                    iou_threshold: float = 0.3, 
-                    sigma: float = 0.5, 
-                    min_score: float = 1e-3, 
-                    method: str = 'linear') -> tuple[torch.Tensor, torch.Tensor]:
+
+    # A stable sort breaks score ties by index, as ``nms_numba`` does.
+    order = torch.argsort(scores, descending=True, stable=True)
+    suppress = _suppression_matrix(boxes[order], iou_threshold)
+    return order[_greedy_keep(suppress)]
+
+
+def soft_nms_pytorch(boxes: torch.Tensor,
+                     scores: torch.Tensor,
+                     iou_threshold: float = 0.3,
+                     sigma: float = 0.5,
+                     min_score: float = 1e-3,
+                     method: int = 1) -> tuple[torch.Tensor, torch.Tensor]:
     """
     Pure PyTorch implementation of Soft-NMS without CUDA dependencies.
-    
+
+    Each iteration picks the highest-scoring remaining box, decays the
+    scores of all other remaining boxes at once and drops those that fall
+    below ``min_score``.
+
     Args:
         boxes (torch.Tensor): Boxes in shape (N, 4).
         scores (torch.Tensor): Scores in shape (N, ).
         iou_threshold (float): IoU threshold for NMS.
         sigma (float): Parameter for Gaussian method.
         min_score (float): Score filter threshold.
-        method (str): 'linear', 'gaussian' or 'naive'.
+        method (int): 0 for naive, 1 for linear and 2 for gaussian.
         
     Returns:
-        tuple: (kept_boxes, kept_indices)
+        tuple: (kept_boxes, kept_indices), where kept_boxes has shape (K, 5)
+        holding the boxes with their decayed scores, in the order in which
+        they were picked.
     """
-    if boxes.shape[0] == 0:
-        return torch.zeros((0, 5), device=boxes.device), torch.tensor([], dtype=torch.int64, device=boxes.device)
-    
+    if method == 0:
+        # ``~(iou <= thr)`` so that NaN IoUs suppress, like the hard NMS.
+        def decay(iou):
+            return (iou <= iou_threshold).to(iou.dtype)
+    elif method == 1:
+
+        def decay(iou):
+            return torch.where(iou > iou_threshold, 1 - iou, 1.)
+    elif method == 2:
+
+        def decay(iou):
+            return torch.exp(iou.square().div_(-sigma))
+    else:
+        raise ValueError(f'Method {method} not recognized. Use 0 (naive), '
+                         '1 (linear) or 2 (gaussian).')
+
     device = boxes.device
-    N = boxes.shape[0]
+    if boxes.shape[0] == 0:
+        inds = torch.tensor([], dtype=torch.int64, device=device)
+        return boxes.new_zeros((0, 5)), inds
+
+    x1, y1, x2, y2 = boxes.unbind(dim=1)
+    areas = (x2 - x1) * (y2 - y1)
+
+    # Remaining boxes and their current scores.
+    remaining = torch.arange(boxes.shape[0], device=device)
+    remaining_scores = scores.clone()
+
+    keep_inds = []
+    keep_scores = []
+    while remaining.numel() > 0:
+        top = int(torch.argmax(remaining_scores))
+        i = remaining[top]
+        keep_inds.append(i)
+        keep_scores.append(remaining_scores[top])
+
+        others = torch.ones_like(remaining, dtype=torch.bool)
+        others[top] = False
+        remaining = remaining[others]
+        remaining_scores = remaining_scores[others]
+
+        w = (torch.min(x2[i], x2[remaining]) -
+             torch.max(x1[i], x1[remaining])).clamp_(min=0)
+        h = (torch.min(y2[i], y2[remaining]) -
+             torch.max(y1[i], y1[remaining])).clamp_(min=0)
+        inter = w.mul_(h)
+        iou = inter / (areas[i] + areas[remaining] - inter)
+
+        remaining_scores = remaining_scores * decay(iou)
+        valid = remaining_scores >= min_score
+        remaining = remaining[valid]
+        remaining_scores = remaining_scores[valid]
+
+    inds = torch.stack(keep_inds)
+    dets = torch.cat([boxes[inds], torch.stack(keep_scores)[:, None]], dim=1)
+    return dets, inds
+
+
+def _nms_kernel(boxes, order, iou_threshold):
+    """Greedy NMS over NumPy arrays, compiled with Numba when available.
+
+    Visits boxes in ``order`` and returns the kept indices in that order.
+    """
+    num_boxes = order.shape[0]
     x1 = boxes[:, 0]
     y1 = boxes[:, 1]
     x2 = boxes[:, 2]
     y2 = boxes[:, 3]
     areas = (x2 - x1) * (y2 - y1)
-    
-    # Clone scores and initialize tensor for keeping track of indices
-    scores_modified = scores.clone()
-    indices = torch.arange(N, device=device)
-    
-    # Loop until scores are below threshold or we've processed all boxes
-    i = 0
-    while i < scores_modified.shape[0]:
-        # Pick the box with highest score
-        max_score_idx = torch.argmax(scores_modified)
-        boxes[max_score_idx:max_score_idx+1]
-        
-        # Swap the box with the first position
-        if max_score_idx != i:
-            boxes[i], boxes[max_score_idx] = boxes[max_score_idx].clone(), boxes[i].clone()
-            scores_modified[i], scores_modified[max_score_idx] = scores_modified[max_score_idx].clone(), scores_modified[i].clone()
-            indices[i], indices[max_score_idx] = indices[max_score_idx].clone(), indices[i].clone()
-            areas[i], areas[max_score_idx] = areas[max_score_idx].clone(), areas[i].clone()
-        
-        # Move to next position
-        i += 1
-        
-        # If no more boxes remain, exit loop
-        if i >= scores_modified.shape[0]:
-            break
-        
-        # Calculate IoU of current box with the rest
-        xx1 = torch.max(boxes[i-1, 0], boxes[i:, 0])
-        yy1 = torch.max(boxes[i-1, 1], boxes[i:, 1])
-        xx2 = torch.min(boxes[i-1, 2], boxes[i:, 2])
-        yy2 = torch.min(boxes[i-1, 3], boxes[i:, 3])
-        
-        w = torch.clamp(xx2 - xx1, min=0)
-        h = torch.clamp(yy2 - yy1, min=0)
-        inter = w * h
-        
-        iou = inter / (areas[i-1] + areas[i:] - inter)
-        
-        # Apply different soft-NMS methods to decay scores
-        if method == 'naive':
-            # Simply set scores to 0 if IoU > threshold
-            decay = (iou <= iou_threshold).float()
-        elif method == 'linear':
-            # Linear decay: (1 - IoU) if IoU > threshold
-            decay = torch.ones_like(iou)
-            decay[iou > iou_threshold] = 1 - iou[iou > iou_threshold]
-        elif method == 'gaussian':
-            # Gaussian decay: exp(-IoU² / sigma)
-            decay = torch.exp(-torch.pow(iou, 2) / sigma)
-        else:
-            raise ValueError(f"Method '{method}' not recognized. Use 'naive', 'linear', or 'gaussian'.")
-        
-        # Apply decay to scores
-        scores_modified[i:] = scores_modified[i:] * decay
-        
-        # Remove boxes with scores below min_score
-        keep_indices = torch.where(scores_modified[i:] >= min_score)[0] + i
-        
-        if keep_indices.shape[0] == 0:
-            break
-        
-        # Keep only boxes above min_score
-        boxes = torch.cat([boxes[:i], boxes[keep_indices]])
-        scores_modified = torch.cat([scores_modified[:i], scores_modified[keep_indices]])
-        indices = torch.cat([indices[:i], indices[keep_indices]])
-        areas = torch.cat([areas[:i], areas[keep_indices]])
-    
-    # Prepare output: concatenate boxes and scores
-    dets = torch.cat([boxes, scores_modified.unsqueeze(1)], dim=1)
-    
-    # Only keep boxes with scores above min_score
-    keep = scores_modified >= min_score
-    return dets[keep], indices[keep]
-
-
-def nms_match_pytorch(dets: torch.Tensor, iou_threshold: float) -> list[torch.Tensor]:
+    suppressed = np.zeros(boxes.shape[0], dtype=np.bool_)
+    keep = np.empty(num_boxes, dtype=np.int64)
+    num_keep = 0
+    for _i in range(num_boxes):
+        i = order[_i]
+        if suppressed[i]:
+            continue
+        keep[num_keep] = i
+        num_keep += 1
+        for _j in range(_i + 1, num_boxes):
+            j = order[_j]
+            if suppressed[j]:
+                continue
+            w = max(min(x2[i], x2[j]) - max(x1[i], x1[j]), 0)
+            h = max(min(y2[i], y2[j]) - max(y1[i], y1[j]), 0)
+            inter = w * h
+            iou = inter / (areas[i] + areas[j] - inter)
+            if not iou <= iou_threshold:
+                suppressed[j] = True
+    return keep[:num_keep]
+
+
+def _soft_nms_decay(x1, y1, x2, y2, areas, scores, num_remaining, top,
+                    iou_threshold, sigma, method):
+    """Decay ``scores[:num_remaining]`` by their IoU with box ``top``.
+
+    The method branch sits outside the loops, which leaves each loop body
+    branch-light so that LLVM can vectorize it.
+    """
+    tx1, ty1, tx2, ty2, tarea = x1[top], y1[top], x2[top], y2[top], \
+        areas[top]
+    if method == 0:
+        for j in range(num_remaining):
+            w = max(min(tx2, x2[j]) - max(tx1, x1[j]), 0)
+            h = max(min(ty2, y2[j]) - max(ty1, y1[j]), 0)
+            inter = w * h
+            iou = inter / (tarea + areas[j] - inter)
+            if not iou <= iou_threshold:
+                scores[j] = 0
+    elif method == 1:
+        for j in range(num_remaining):
+            w = max(min(tx2, x2[j]) - max(tx1, x1[j]), 0)
+            h = max(min(ty2, y2[j]) - max(ty1, y1[j]), 0)
+            inter = w * h
+            iou = inter / (tarea + areas[j] - inter)
+            if iou > iou_threshold:
+                scores[j] *= 1 - iou
+    else:
+        for j in range(num_remaining):
+            w = max(min(tx2, x2[j]) - max(tx1, x1[j]), 0)
+            h = max(min(ty2, y2[j]) - max(ty1, y1[j]), 0)
+            inter = w * h
+            iou = inter / (tarea + areas[j] - inter)
+            scores[j] *= np.exp(-(iou * iou) / sigma)
+
+
+def _soft_nms_kernel(boxes, scores, iou_threshold, sigma, min_score, method):
+    """Soft-NMS over NumPy arrays, compiled with Numba when available.
+
+    Returns the kept indices and their decayed scores in pick order.
+    """
+    num_boxes = boxes.shape[0]
+    # Structure-of-arrays copies of the remaining boxes, compacted together
+    # after every pick, so that the decay loops stream over contiguous
+    # arrays.
+    x1 = boxes[:, 0].copy()
+    y1 = boxes[:, 1].copy()
+    x2 = boxes[:, 2].copy()
+    y2 = boxes[:, 3].copy()
+    areas = (x2 - x1) * (y2 - y1)
+    scores = scores.copy()
+    remaining = np.arange(num_boxes)
+    keep = np.empty(num_boxes, dtype=np.int64)
+    keep_scores = np.empty_like(scores)
+    num_keep = 0
+    num_remaining = num_boxes
+    while num_remaining > 0:
+        top = 0
+        for j in range(1, num_remaining):
+            if scores[j] > scores[top]:
+                top = j
+        keep[num_keep] = remaining[top]
+        keep_scores[num_keep] = scores[top]
+        num_keep += 1
+
+        # ``top`` decays itself too but is dropped when compacting.
+        _soft_nms_decay(x1, y1, x2, y2, areas, scores, num_remaining, top,
+                        iou_threshold, sigma, method)
+        num_left = 0
+        for j in range(num_remaining):
+            if j != top and scores[j] >= min_score:
+                x1[num_left] = x1[j]
+                y1[num_left] = y1[j]
+                x2[num_left] = x2[j]
+                y2[num_left] = y2[j]
+                areas[num_left] = areas[j]
+                scores[num_left] = scores[j]
+                remaining[num_left] = remaining[j]
+                num_left += 1
+        num_remaining = num_left
+    return keep[:num_keep], keep_scores[:num_keep]
+
+
+if numba is not None:
+    # ``error_model='numpy'`` lets degenerate boxes produce a NaN IoU
+    # instead of raising ZeroDivisionError, matching the tensor version.
+    # Bounds checks are off so that they do not block vectorization.
+    _njit = numba.njit(cache=True, error_model='numpy', boundscheck=False)
+    _nms_kernel = _njit(_nms_kernel)
+    _soft_nms_decay = _njit(_soft_nms_decay)
+    _soft_nms_kernel = _njit(_soft_nms_kernel)
+
+
+def nms_numba(boxes: np.ndarray,
+              scores: np.ndarray,
+              iou_threshold: float,
+              score_threshold: float = 0,
+              max_num: int = -1) -> np.ndarray:
+    """
+    NMS for NumPy arrays that runs the greedy loop in one compiled Numba
+    kernel, without converting to tensors.
+
+    Gives the same indices as :func:`nms_pytorch`, including the order of
+    boxes with tied scores. Without Numba installed the kernel runs as plain
+    Python, so callers should only route here when ``numba`` is importable.
+
+    Args:
+        boxes (np.ndarray): Boxes in shape (N, 4).
+        scores (np.ndarray): Scores in shape (N, ).
+        iou_threshold (float): IoU threshold for NMS.
+        score_threshold (float): Boxes scoring at most this are dropped
+            before NMS when it is positive.
+        max_num (int): Maximum number of kept boxes, unlimited if not
+            positive.
+
+    Returns:
+        np.ndarray: Indices of kept boxes in decreasing score order.
+    """
+    order = np.argsort(-scores, kind='stable')
+    if score_threshold > 0:
+        order = order[scores[order] > score_threshold]
+    # Integer boxes are compared in floating point, as in ``nms_pytorch``.
+    dtype = np.result_type(boxes.dtype, np.float32)
+    inds = _nms_kernel(
+        np.ascontiguousarray(boxes, dtype=dtype), order,
+        dtype.type(iou_threshold))
+    if max_num > 0:
+        inds = inds[:max_num]
+    return inds
+
+
+def soft_nms_numba(boxes: torch.Tensor,
+                   scores: torch.Tensor,
+                   iou_threshold: float = 0.3,
+                   sigma: float = 0.5,
+                   min_score: float = 1e-3,
+                   method: int = 1) -> tuple[torch.Tensor, torch.Tensor]:
+    """
+    Soft-NMS for CPU tensors that runs the whole greedy loop in one
+    compiled Numba kernel instead of dispatching tensor ops per pick.
+
+    Arguments and return values are the same as :func:`soft_nms_pytorch`.
+    Without Numba installed the kernel runs as plain Python, so callers
+    should only route here when ``numba`` is importable.
+    """
+    if method not in (0, 1, 2):
+        raise ValueError(f'Method {method} not recognized. Use 0 (naive), '
+                         '1 (linear) or 2 (gaussian).')
+    if boxes.shape[0] == 0:
+        inds = torch.tensor([], dtype=torch.int64, device=boxes.device)
+        return boxes.new_zeros((0, 5)), inds
+
+    np_boxes = boxes.detach().contiguous().numpy()
+    np_scores = scores.detach().to(boxes.dtype).contiguous().numpy()
+    # Thresholds are cast to the box dtype so that comparisons happen in
+    # the same precision as in the tensor implementation.
+    cast = np_boxes.dtype.type
+    inds, kept_scores = _soft_nms_kernel(np_boxes, np_scores,
+                                         cast(iou_threshold), cast(sigma),
+                                         cast(min_score), method)
+    inds = torch.from_numpy(inds)
+    dets = torch.cat(
+        [boxes[inds], torch.from_numpy(kept_scores)[:, None]], dim=1)
+    return dets, inds
+
+
+def nms_match_pytorch(dets: torch.Tensor,
+                      iou_threshold: float) -> list[torch.Tensor]:
     """
     Pure PyTorch implementation of NMS match without CUDA dependencies.
-    
+
+    The group heads are the boxes kept by greedy NMS, and every suppressed
+    box joins the highest-scoring head that overlaps it. Groups are formed
+    with one stable sort on the head of each box instead of a Python loop.
+
     Args:
         dets (torch.Tensor): Det boxes with scores, shape (N, 5).
         iou_threshold (float): IoU threshold for NMS.
@@ -176,173 +415,60 @@ def nms_match_pytorch(dets: torch.Tensor, iou_threshold: float) -> list[torch.Te
     """
     if dets.shape[0] == 0:
         return []
-    
-    scores = dets[:, 4]
-    boxes = dets[:, :4]
-    
-    # Sort boxes by scores
-    _, order = torch.sort(scores, descending=True)
-    
-    # Initialize list to store matched groups
-    matched_groups = []
-    unmatched = torch.ones(dets.shape[0], dtype=torch.bool, device=dets.device)
-    
-    # Compute areas once for all boxes
-    x1 = boxes[:, 0]
-    y1 = boxes[:, 1]
-    x2 = boxes[:, 2]
-    y2 = boxes[:, 3]
-    areas = (x2 - x1) * (y2 - y1)
-    
-    # Process boxes in order of descending scores
-    for i in range(order.size(0)):
-        if not unmatched[order[i]]:
-            continue
-        
-        # Create a new group with this box
-        group = [order[i].item()]
-        unmatched[order[i]] = False
-        
-        # Find boxes that match with this one
-        box_i = boxes[order[i]]
-        
-        # Process remaining boxes
-        for j in range(i + 1, order.size(0)):
-            if not unmatched[order[j]]:
-                continue
-            
-            box_j = boxes[order[j]]
-            
-            # Compute IoU
-            xx1 = torch.max(box_i[0], box_j[0])
-            yy1 = torch.max(box_i[1], box_j[1])
-            xx2 = torch.min(box_i[2], box_j[2])
-            yy2 = torch.min(box_i[3], box_j[3])
-            
-            w = torch.clamp(xx2 - xx1, min=0)
-            h = torch.clamp(yy2 - yy1, min=0)
-            inter = w * h
-            
-            iou = inter / (areas[order[i]] + areas[order[j]] - inter)
-            
-            # If IoU exceeds threshold, add box to this group
-            if iou > iou_threshold:
-                group.append(order[j].item())
-                unmatched[order[j]] = False
-        
-        # Sort group by score and add to matched groups
-        group_scores = scores[group]
-        _, group_order = torch.sort(group_scores, descending=True)
-        sorted_group = [group[idx] for idx in group_order.tolist()]
-        matched_groups.append(torch.tensor(sorted_group, dtype=torch.long, device=dets.device))
-    
-    return matched_groups
-
-
-def nms_quadri_pytorch(dets: torch.Tensor, 
-                       scores: torch.Tensor, 
-                       iou_threshold: float, 
-                       labels: torch.Tensor | None = None) -> tuple[torch.Tensor, torch.Tensor]:
+
+    order = torch.argsort(dets[:, 4], descending=True)
+    suppress = _suppression_matrix(dets[order, :4], iou_threshold)
+    keep = _greedy_keep(suppress)
+
+    # Index (in score order) of the first kept box overlapping each box;
+    # kept boxes are their own head.
+    heads = (suppress & keep[:, None]).byte().argmax(dim=0)
+    heads[keep] = torch.nonzero(keep, as_tuple=True)[0]
+
+    heads, perm = torch.sort(heads, stable=True)
+    counts = torch.unique_consecutive(heads, return_counts=True)[1]
+    return list(order[perm].split(counts.tolist()))
+
+
+def nms_quadri_pytorch(
+        dets: torch.Tensor,
+        scores: torch.Tensor,
+        iou_threshold: float,
+        labels: torch.Tensor | None = None
+) -> tuple[torch.Tensor, torch.Tensor]:
     """
     Pure PyTorch implementation of Quadrilateral NMS without CUDA dependencies.
-    
+
+    The exact polygon IoU is evaluated, batched over all higher-scoring/
+    lower-scoring pairs whose axis-aligned bounds overlap, and greedy NMS
+    is resolved on the resulting suppression matrix as in ``nms_pytorch``.
+
     Args:
-        dets (torch.Tensor): Quadri boxes in shape (N, 8). 
+        dets (torch.Tensor): Quadri boxes in shape (N, 8).
             They are expected to be in (x1, y1, ..., x4, y4) format.
         scores (torch.Tensor): Scores in shape (N, ).
         iou_threshold (float): IoU threshold for NMS.
-        labels (torch.Tensor, optional): Boxes' label in shape (N,).
-        
+        labels (torch.Tensor, optional): Boxes' label in shape (N,). As in
+            the reference CPU implementation, labels do not restrict
+            suppression; use ``batched_nms`` for per-class NMS.
+
     Returns:
-        tuple: (kept_boxes_with_scores, kept_indices)
+        tuple: (kept_boxes_with_scores, kept_indices), in score order.
     """
     if dets.shape[0] == 0:
         return dets, torch.tensor([], dtype=torch.int64, device=dets.device)
-    
-    device = dets.device
-    
-    # Set up for multi-label case
-    multi_label = labels is not None
-    if multi_label:
-        dets_with_labels = torch.cat((dets, labels.unsqueeze(1)), 1)
-    else:
-        dets_with_labels = dets
-    
-    # Sort scores
-    _, order = scores.sort(0, descending=True)
-    dets_with_labels.index_select(0, order)
-    
-    # Convert quadrilaterals to polygons for IoU computation
-    num_dets = dets.shape[0]
-    keep = torch.zeros(num_dets, dtype=torch.bool, device=device)
-    
-    # Loop through boxes
-    for i in range(num_dets):
-        if i >= order.shape[0]:
-            break
-        
-        # Current box
-        current_idx = order[i]
-        keep[current_idx] = True
-        
-        # Skip if we've processed all boxes
-        if i == num_dets - 1:
-            break
-            
-        # Get current quad points
-        quad_i = dets[current_idx].reshape(4, 2)
-        
-        # Check against remaining boxes
-        for j in range(i + 1, num_dets):
-            # Get comparison quad
-            compare_idx = order[j]
-            
-            # If boxes have different labels and we're using multi_label, they don't suppress each other
-            if multi_label and labels[current_idx] != labels[compare_idx]:
-                continue
-                
-            quad_j = dets[compare_idx].reshape(4, 2)
-            
-            # Compute IoU between two quadrilaterals
-            # This is an approximation - proper quad IoU is complex
-            # Convert to pixel masks and compute IoU
-            # For simplicity, we use bounding box IoU as an approximation
-            
-            # Get bounding box for each quad
-            x1_i, y1_i = torch.min(quad_i[:, 0]), torch.min(quad_i[:, 1])
-            x2_i, y2_i = torch.max(quad_i[:, 0]), torch.max(quad_i[:, 1])
-            
-            x1_j, y1_j = torch.min(quad_j[:, 0]), torch.min(quad_j[:, 1])
-            x2_j, y2_j = torch.max(quad_j[:, 0]), torch.max(quad_j[:, 1])
-            
-            # Compute IoU of bounding boxes
-            xx1 = torch.max(x1_i, x1_j)
-            yy1 = torch.max(y1_i, y1_j)
-            xx2 = torch.min(x2_i, x2_j)
-            yy2 = torch.min(y2_i, y2_j)
-            
-            w = torch.max(torch.tensor(0., device=device), xx2 - xx1)
-            h = torch.max(torch.tensor(0., device=device), yy2 - yy1)
-            
-            area_i = (x2_i - x1_i) * (y2_i - y1_i)
-            area_j = (x2_j - x1_j) * (y2_j - y1_j)
-            inter = w * h
-            
-            # IoU = intersection / union
-            iou = inter / (area_i + area_j - inter)
-            
-            # If IoU exceeds threshold, suppress the box
-            if iou > iou_threshold:
-                keep[compare_idx] = False
-    
-    # Get indices of kept boxes
-    keep_inds = torch.nonzero(keep).squeeze(1)
-    
-    # Sort by original order
-    _, order_keep = torch.sort(order.new_tensor([torch.where(order == i)[0].item() for i in keep_inds]))
-    keep_inds = keep_inds[order_keep]
-    
-    # Prepare output
-    dets_out = torch.cat((dets[keep_inds], scores[keep_inds].reshape(-1, 1)), dim=1)
-    
-    return dets_out, keep_inds
\ No newline at end of file
+
+    order = torch.argsort(scores, descending=True)
+    quads = dets[order]
+    bounds = quadri_bounds(quads)
+    overlap = ((bounds[:, None, :2] <= bounds[None, :, 2:]) &
+               (bounds[None, :, :2] <= bounds[:, None, 2:])).all(-1)
+    rows, cols = torch.nonzero(overlap.triu_(diagonal=1), as_tuple=True)
+    suppress = torch.zeros_like(overlap)
+    suppress[rows, cols] = quadri_iou_aligned(quads[rows],
+                                              quads[cols]) > iou_threshold
+    keep_inds = order[_greedy_keep(suppress)]
+
+    dets_out = torch.cat((dets[keep_inds], scores[keep_inds].reshape(-1, 1)),
+                         dim=1)
+    return dets_out, keep_inds
@@ -1,23 +1,103 @@
-import warnings
-
 import torch
 
+# Offsets (dy, dx) of the 4-connected neighbours, in the order the reference
+# implementation visits them.
+_NEIGHBOURS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
 
-def pixel_group_pytorch(*args, **kwargs):
+def pixel_group_pytorch(score: torch.Tensor, mask: torch.Tensor,
+                        embedding: torch.Tensor, kernel_label: torch.Tensor,
+                        kernel_contour: torch.Tensor, kernel_region_num: int,
+                        distance_threshold: float) -> list[list[float]]:
     """
-    PyTorch-only stub implementation of pixel_group.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of pixel_group.
+
+    The embedding distance of every pixel to every kernel mean is computed
+    in one ``cdist`` call. Kernels then grow from their contour pixels into
+    4-connected foreground pixels that are close enough to the kernel, one
+    breadth-first level per step for all kernels at once, resolving pixels
+    reached by several kernels in the same step exactly as the queue-based
+    reference implementation does.
+
+    Args:
+        score (torch.Tensor): The foreground score with size hxw.
+        mask (torch.Tensor): The foreground mask with size hxw.
+        embedding (torch.Tensor): The embedding with size hxwxc.
+        kernel_label (torch.Tensor): The instance kernel index with size hxw.
+        kernel_contour (torch.Tensor): The kernel contour with size hxw.
+        kernel_region_num (int): The instance kernel region number.
+        distance_threshold (float): The embedding distance threshold between
+            kernel and pixel in one instance.
+
+    Returns:
+        list[list[float]]: For each kernel label, the averaged score, the
+        pixel number and the (x, y) coordinates of its pixels in row-major
+        order. Labels without pixels get ``[0, 0]``.
     """
-    warnings.warn("Using stub implementation of pixel_group. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    height, width, embedding_dim = embedding.shape
+    labels = kernel_label.to(torch.int64, copy=True)
+    flat_labels = labels.view(-1)
+    flat_embedding = embedding.reshape(-1, embedding_dim).float()
+
+    in_kernel = flat_labels > 0
+    kernel_sums = flat_embedding.new_zeros(kernel_region_num, embedding_dim)
+    kernel_sums.index_add_(0, flat_labels[in_kernel],
+                           flat_embedding[in_kernel])
+    kernel_sizes = torch.bincount(
+        flat_labels[in_kernel], minlength=kernel_region_num)
+    kernel_means = kernel_sums / kernel_sizes[:, None]
+    # (h * w, kernel_region_num); labels without kernel pixels have a NaN
+    # mean and are never close to anything.
+    close = torch.cdist(
+        flat_embedding,
+        kernel_means,
+        compute_mode='donot_use_mm_for_euclid_dist').lt(distance_threshold)
+
+    # The frontier is kept as flat pixel positions in the order of the
+    # reference implementation's FIFO queue: seeds are queued in row-major
+    # order, and a pixel is claimed by the first queued neighbour that
+    # reaches it, trying neighbours in ``_NEIGHBOURS`` order.
+    free = mask.reshape(-1).bool() & ~in_kernel
+    offsets = torch.tensor(_NEIGHBOURS, device=labels.device)
+    frontier = torch.nonzero(
+        in_kernel & kernel_contour.reshape(-1).bool(), as_tuple=True)[0]
+    while frontier.numel() > 0:
+        # (F, 4) candidates, flattened in (queue position, direction) order.
+        ys = (frontier // width)[:, None] + offsets[:, 0]
+        xs = (frontier % width)[:, None] + offsets[:, 1]
+        src = flat_labels[frontier][:, None].expand(-1, 4)
+        inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+        ys, xs, src = ys[inside], xs[inside], src[inside]
+        dst = ys * width + xs
+        valid = free[dst] & close[dst, src]
+        dst, src = dst[valid], src[valid]
+
+        # Keep the first claim on every pixel, in queue order.
+        claimed, inverse = torch.unique(dst, return_inverse=True)
+        first = torch.full_like(claimed, dst.numel()).scatter_reduce_(
+            0, inverse, torch.arange(dst.numel(), device=dst.device),
+            'amin').sort().values
+        frontier = dst[first]
+        flat_labels[frontier] = src[first]
+        free[frontier] = False
+
+    pos = torch.nonzero(flat_labels > 0, as_tuple=True)[0]
+    pos_labels, order = torch.sort(flat_labels[pos], stable=True)
+    pos = pos[order]
+    counts = torch.bincount(pos_labels, minlength=kernel_region_num)
+    score_sums = torch.bincount(
+        pos_labels,
+        weights=score.reshape(-1)[pos].float(),
+        minlength=kernel_region_num)
+    coords = torch.stack([pos % width, pos // width], dim=1).float()
+
+    results = []
+    for label, (count, score_sum, label_coords) in enumerate(
+            zip(counts.tolist(), score_sums.tolist(),
+                coords.split(counts.tolist()))):
+        if label == 0 or count == 0:
+            results.append([0., 0.])
+        else:
+            results.append([score_sum / count, float(count)] +
+                           label_coords.view(-1).tolist())
+    return results
@@ -1,23 +1,32 @@
-import warnings
-
 import torch
 
 
-def points_in_polygons_forward_pytorch(*args, **kwargs):
+def points_in_polygons_forward_pytorch(points: torch.Tensor,
+                                       polygons: torch.Tensor,
+                                       output: torch.Tensor) -> torch.Tensor:
     """
-    PyTorch-only stub implementation of points_in_polygons_forward.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of points_in_polygons_forward.
+
+    For every point and every edge of a quadrilateral, the cross product of
+    the edge with the vector from its start vertex to the point is computed
+    by broadcasting (B, 1, 4) against (1, M, 4). As in the CUDA kernel, a
+    point is inside when the cross products of both pairs of opposite edges
+    have the same strict sign, so points on the boundary count as outside.
+
+    Args:
+        points (torch.Tensor): Points in shape (B, 2).
+        polygons (torch.Tensor): Quadrilaterals in shape (M, 8).
+        output (torch.Tensor): Tensor in shape (B, M) the result is written
+            into, 1 for inside and 0 for outside.
+
+    Returns:
+        torch.Tensor: ``output``.
     """
-    warnings.warn("Using stub implementation of points_in_polygons_forward. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    vertices = polygons.view(-1, 4, 2)
+    edges = vertices.roll(-1, dims=1) - vertices
+    dx = points[:, 0, None, None] - vertices[..., 0]
+    dy = points[:, 1, None, None] - vertices[..., 1]
+    cross = edges[..., 0] * dy - edges[..., 1] * dx
+    inside = ((cross[..., 0] * cross[..., 2] > 0) &
+              (cross[..., 1] * cross[..., 3] > 0))
+    return output.copy_(inside)
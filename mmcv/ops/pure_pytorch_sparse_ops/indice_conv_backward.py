@@ -1,23 +1,55 @@
-import warnings
-
 import torch
 
 
-def indice_conv_backward_pytorch(*args, **kwargs):
+def indice_conv_backward_pytorch(
+        features: torch.Tensor, filters: torch.Tensor, out_bp: torch.Tensor,
+        indice_pairs: torch.Tensor, indice_pair_num: torch.Tensor,
+        inverse: int, subm: int) -> tuple[torch.Tensor, torch.Tensor]:
     """
-    PyTorch-only stub implementation of indice_conv_backward.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of indice_conv_backward.
+
+    For every kernel offset, the input features and output gradients of its
+    indice pairs are gathered and the gradients are obtained with two
+    matrix products, the input gradient being scattered back with
+    ``index_add_``. As in the CUDA kernel, the centre offset of a
+    submanifold convolution maps every input to itself and is computed on
+    the whole tensors.
+
+    Args:
+        features (torch.Tensor): Input features in shape (N_in, C_in).
+        filters (torch.Tensor): Filters in shape (*kernel_size, C_in, C_out).
+        out_bp (torch.Tensor): Output gradient in shape (N_out, C_out).
+        indice_pairs (torch.Tensor): Indice pairs in shape
+            (kernel_volume, 2, max_pairs).
+        indice_pair_num (torch.Tensor): Number of valid pairs per kernel
+            offset, in shape (kernel_volume, ).
+        inverse (int): Whether the convolution is an inverse one, which
+            swaps the roles of the two rows of ``indice_pairs``.
+        subm (int): Whether the convolution is a submanifold one.
+
+    Returns:
+        tuple[torch.Tensor, torch.Tensor]: Gradients of ``features`` and
+        ``filters``.
     """
-    warnings.warn("Using stub implementation of indice_conv_backward. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    num_in_planes, num_out_planes = filters.shape[-2:]
+    flat_filters = filters.reshape(-1, num_in_planes, num_out_planes)
+    kernel_volume = flat_filters.shape[0]
+    center = kernel_volume // 2
+    in_row = int(bool(inverse))
+
+    input_bp = torch.zeros_like(features)
+    filters_bp = torch.zeros_like(flat_filters)
+    if subm:
+        torch.mm(features.t(), out_bp, out=filters_bp[center])
+        torch.mm(out_bp, flat_filters[center].t(), out=input_bp)
+
+    for i, num_pairs in enumerate(indice_pair_num.tolist()):
+        if num_pairs <= 0 or (subm and i == center):
+            continue
+        in_inds = indice_pairs[i, in_row, :num_pairs].long()
+        out_inds = indice_pairs[i, 1 - in_row, :num_pairs].long()
+        in_buffer = features.index_select(0, in_inds)
+        out_buffer = out_bp.index_select(0, out_inds)
+        torch.mm(in_buffer.t(), out_buffer, out=filters_bp[i])
+        input_bp.index_add_(0, in_inds, out_buffer.mm(flat_filters[i].t()))
+    return input_bp, filters_bp.view_as(filters)
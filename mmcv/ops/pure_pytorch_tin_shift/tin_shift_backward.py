@@ -1,23 +1,24 @@
-import warnings
-
 import torch
 
+from .tin_shift_forward import tin_shift_forward_pytorch
+
 
-def tin_shift_backward_pytorch(*args, **kwargs):
+def tin_shift_backward_pytorch(grad_output: torch.Tensor, shift: torch.Tensor,
+                               grad_input: torch.Tensor) -> torch.Tensor:
     """
-    PyTorch-only stub implementation of tin_shift_backward.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of tin_shift_backward.
+
+    Like the reference CUDA kernel, the output gradient is shifted with the
+    same offsets as the forward pass, so this reuses the forward gather.
+
+    Args:
+        grad_output (torch.Tensor): Gradient of the output in shape
+            (N, T, C, H * W).
+        shift (torch.Tensor): Integer shifts in shape (N, num_segments).
+        grad_input (torch.Tensor): Tensor with the shape of ``grad_output``
+            the gradient of the input is written into.
+
+    Returns:
+        torch.Tensor: ``grad_input``.
     """
-    warnings.warn("Using stub implementation of tin_shift_backward. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    return tin_shift_forward_pytorch(grad_output, shift, grad_input)
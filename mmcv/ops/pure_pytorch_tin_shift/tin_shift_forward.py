@@ -1,23 +1,37 @@
-import warnings
-
 import torch
 
 
-def tin_shift_forward_pytorch(*args, **kwargs):
+def tin_shift_forward_pytorch(input: torch.Tensor, shift: torch.Tensor,
+                              output: torch.Tensor) -> torch.Tensor:
     """
-    PyTorch-only stub implementation of tin_shift_forward.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of tin_shift_forward.
+
+    The channels are split into ``num_segments`` groups and every group of
+    every sample is shifted along the temporal dimension by its own integer
+    offset, with zeros shifted in. All shifts are applied by one advanced
+    indexing gather over a (N, T, num_segments) source-frame index.
+
+    Args:
+        input (torch.Tensor): Feature map in shape (N, T, C, H * W).
+        shift (torch.Tensor): Integer shifts in shape (N, num_segments).
+        output (torch.Tensor): Tensor with the shape of ``input`` the result
+            is written into.
+
+    Returns:
+        torch.Tensor: ``output``.
     """
-    warnings.warn("Using stub implementation of tin_shift_forward. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    batch_size, num_frames, channels, spatial = input.shape
+    num_segments = shift.shape[1]
+    x = input.view(batch_size, num_frames, num_segments,
+                   channels // num_segments, spatial)
+
+    # Output frame t of a group shifted by s reads input frame t - s.
+    frames = torch.arange(num_frames, device=input.device)
+    src = frames[None, :, None] - shift.long()[:, None, :]
+    valid = (src >= 0) & (src < num_frames)
+    src.clamp_(0, num_frames - 1)
+    batch_inds = torch.arange(batch_size, device=input.device)[:, None, None]
+    group_inds = torch.arange(num_segments, device=input.device)
+    shifted = x[batch_inds, src, group_inds]
+    shifted.masked_fill_(~valid[..., None, None], 0)
+    return output.copy_(shifted.view_as(input))
@@ -1,23 +1,52 @@
-import warnings
-
 import torch
+import torch.nn.functional as F
 
 
-def upfirdn2d_pytorch(*args, **kwargs):
+def upfirdn2d_pytorch(x: torch.Tensor, f: torch.Tensor, upx: int, upy: int,
+                      downx: int, downy: int, padx0: int, padx1: int,
+                      pady0: int, pady1: int, flip_filter: bool,
+                      gain: float) -> torch.Tensor:
     """
-    PyTorch-only stub implementation of upfirdn2d.
-    This is a placeholder for the C++/CUDA implementation.
-    It will raise a warning and return zeros with the appropriate shape.
-    
-    For production use, a proper PyTorch implementation is needed.
+    Pure PyTorch implementation of the upfirdn2d kernel.
+
+    Zeros are inserted to upsample, the result is padded or cropped and
+    then filtered by a depthwise convolution whose stride performs the
+    downsampling, so only the output pixels that are kept get computed.
+
+    Args:
+        x (torch.Tensor): Input in shape (N, C, H, W).
+        f (torch.Tensor): 2D FIR filter in shape (filter_height,
+            filter_width).
+        upx (int): Horizontal upsampling factor.
+        upy (int): Vertical upsampling factor.
+        downx (int): Horizontal downsampling factor.
+        downy (int): Vertical downsampling factor.
+        padx0 (int): Padding on the left, negative values crop.
+        padx1 (int): Padding on the right, negative values crop.
+        pady0 (int): Padding on the top, negative values crop.
+        pady1 (int): Padding on the bottom, negative values crop.
+        flip_filter (bool): False = convolution, True = correlation.
+        gain (float): Scaling factor applied to the filter.
+
+    Returns:
+        torch.Tensor: Output in shape (N, C, out_height, out_width).
     """
-    warnings.warn("Using stub implementation of upfirdn2d. "
-                 "This is not a complete implementation and may cause incorrect results.", stacklevel=2)
-    
-    # Basic handling depending on the expected output shape
-    if len(args) > 0:
-        # Try to return something with a reasonable shape
-        return torch.zeros_like(args[0])
-    
-    # Default fallback
-    return torch.tensor(0.0)
+    batch_size, num_channels, in_height, in_width = x.shape
+
+    # Upsample by inserting zeros.
+    x = x.reshape(batch_size, num_channels, in_height, 1, in_width, 1)
+    x = F.pad(x, [0, upx - 1, 0, 0, 0, upy - 1])
+    x = x.reshape(batch_size, num_channels, in_height * upy, in_width * upx)
+
+    # Pad or crop.
+    x = F.pad(x, [max(padx0, 0), max(padx1, 0), max(pady0, 0), max(pady1, 0)])
+    x = x[:, :,
+          max(-pady0, 0):x.shape[2] - max(-pady1, 0),
+          max(-padx0, 0):x.shape[3] - max(-padx1, 0)]
+
+    # Filter and downsample in one strided depthwise convolution.
+    f = f.to(x.dtype) * gain
+    if not flip_filter:
+        f = f.flip([0, 1])
+    weight = f[None, None].expand(num_channels, 1, -1, -1)
+    return F.conv2d(x, weight, stride=(downy, downx), groups=num_channels)
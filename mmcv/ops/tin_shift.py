@@ -8,12 +8,10 @@ import torch
 import torch.nn as nn
 from torch.autograd import Function
 
-from mmcv.ops.pure_pytorch_tin_shift.tin_shift_forward import tin_shift_forward_pytorch
-from mmcv.ops.pure_pytorch_tin_shift.tin_shift_backward import tin_shift_backward_pytorch
-from mmcv.ops.pure_pytorch_tin_shift.tin_shift_forward import tin_shift_forward_pytorch
-from mmcv.ops.pure_pytorch_tin_shift.tin_shift_backward import tin_shift_backward_pytorch
-
-                                 ['tin_shift_forward', 'tin_shift_backward'])
+from mmcv.ops.pure_pytorch_tin_shift.tin_shift_backward import \
+    tin_shift_backward_pytorch
+from mmcv.ops.pure_pytorch_tin_shift.tin_shift_forward import \
+    tin_shift_forward_pytorch
 
 
 class TINShiftFunction(Function):
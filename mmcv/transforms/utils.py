@@ -1,9 +1,8 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 
-import copy
 import functools
 import inspect
-import weakref
+import types
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import contextmanager
@@ -38,7 +37,9 @@ class cache_randomness:
 
         functools.update_wrapper(self, func)
         self.func = func
-        self.instance_ref = None
+        # Cached values live directly in the instance ``__dict__`` under
+        # this per-method key, so a cached call costs one dict lookup.
+        self.cache_key = _cache_key(func.__name__)
 
     def __set_name__(self, owner, name):
         # Maintain a record of decorated methods in the class
@@ -50,40 +51,40 @@ class cache_randomness:
         # `self.__init__()`
         owner._methods_with_randomness.append(name)
 
-    def __call__(self, *args, **kwargs):
-        # Get the transform instance whose method is decorated
-        # by cache_randomness
-        instance = self.instance_ref()
-        name = self.__name__
+    def __call__(self, instance, *args, **kwargs):
+        # ``instance`` is the transform whose method is decorated by
+        # cache_randomness, bound in ``__get__``.
+        instance_dict = instance.__dict__
 
         # Check the flag ``self._cache_enabled``, which should be
         # set by the contextmanagers like ``cache_random_parameters```
-        cache_enabled = getattr(instance, '_cache_enabled', False)
-
-        if cache_enabled:
-            # Initialize the cache of the transform instances. The flag
-            # ``cache_enabled``` is set by contextmanagers like
-            # ``cache_random_params```.
-            if not hasattr(instance, '_cache'):
-                instance._cache = {}
-
-            if name not in instance._cache:
-                instance._cache[name] = self.func(instance, *args, **kwargs)
-            # Return the cached value
-            return instance._cache[name]
+        if instance_dict.get('_cache_enabled', False):
+            try:
+                # Return the cached value
+                return instance_dict[self.cache_key]
+            except KeyError:
+                output = self.func(instance, *args, **kwargs)
+                instance_dict[self.cache_key] = output
+                return output
         else:
             # Clear cache
-            if hasattr(instance, '_cache'):
-                del instance._cache
+            instance_dict.pop(self.cache_key, None)
             # Return function output
             return self.func(instance, *args, **kwargs)
 
     def __get__(self, obj, cls):
-        self.instance_ref = weakref.ref(obj)
-        # Return a copy to avoid multiple transform instances sharing
-        # one `cache_randomness` instance, which may cause data races
-        # in multithreading cases.
-        return copy.copy(self)
+        if obj is None:
+            return self
+        # Bind to the instance like a regular method. Nothing is stored on
+        # the shared decorator, so multiple transform instances (and
+        # threads) do not race on it.
+        return types.MethodType(self, obj)
+
+
+def _cache_key(method_name: str) -> str:
+    """Return the instance attribute holding the cached output of the
+    ``cache_randomness`` method ``method_name``."""
+    return f'_cached_{method_name}'
 
 
 def avoid_cache_randomness(cls):
@@ -225,8 +226,8 @@ def cache_random_params(transforms: BaseTransform | Iterable):
 
         # Remove cache enabled flag
         delattr(t, '_cache_enabled')
-        if hasattr(t, '_cache'):
-            delattr(t, '_cache')
+        for name in t._methods_with_randomness:
+            t.__dict__.pop(_cache_key(name), None)
 
         # Restore the original method
         if hasattr(t, '_methods_with_randomness'):
@@ -30,6 +30,43 @@ def test_quantize():
         mmcv.quantize(arr, 2, 1, levels)
 
 
+def test_quantize_without_numexpr(monkeypatch):
+    from mmcv.arraymisc import quantization
+    arr = np.random.randn(10, 10)
+    expected = mmcv.quantize(arr, -1, 1, 20)
+    monkeypatch.setattr(quantization, 'numexpr', None)
+    qarr = mmcv.quantize(arr, -1, 1, 20)
+    assert qarr.dtype == np.dtype('int64')
+    assert np.array_equal(qarr, expected)
+
+    qarr = mmcv.quantize(np.arange(-3, 4), -1, 1, 4, dtype=np.uint8)
+    assert qarr.dtype == np.dtype('uint8')
+    assert np.array_equal(qarr, [0, 0, 0, 2, 3, 3, 3])
+
+
+def test_quantize_batch():
+    arrays = [np.random.randn(10, 10), np.random.randn(3), np.zeros((0, 2))]
+    qarrs = mmcv.quantize_batch(arrays, -1, 1, 20)
+    assert len(qarrs) == len(arrays)
+    for arr, qarr in zip(arrays, qarrs):
+        assert qarr.shape == arr.shape
+        assert qarr.dtype == np.dtype('int64')
+        assert np.array_equal(qarr, mmcv.quantize(arr, -1, 1, 20))
+
+    # arrays with different dtypes are quantized one by one
+    arrays = [np.random.randn(4, 4).astype(np.float32), np.arange(-2, 3)]
+    qarrs = mmcv.quantize_batch(arrays, -1, 1, 20, dtype=np.uint8)
+    for arr, qarr in zip(arrays, qarrs):
+        assert qarr.dtype == np.dtype('uint8')
+        assert np.array_equal(qarr, mmcv.quantize(arr, -1, 1, 20, np.uint8))
+
+    assert mmcv.quantize_batch([], -1, 1, 20) == []
+    with pytest.raises(ValueError):
+        mmcv.quantize_batch(arrays, -1, 1, levels=0)
+    with pytest.raises(ValueError):
+        mmcv.quantize_batch(arrays, 2, 1, 20)
+
+
 def test_dequantize():
     levels = 20
     qarr = np.random.randint(levels, size=(10, 10))
@@ -92,6 +92,19 @@ def test_build_conv_layer():
                 assert layer.out_channels == kwargs['out_channels']
                 kwargs['dilation'] = 2  # recover the key
 
+    # modules re-registered with `force=True` are picked up
+    class MyConvA(nn.Conv2d):
+        pass
+
+    class MyConvB(nn.Conv2d):
+        pass
+
+    MODELS.register_module('MyConv', module=MyConvA, force=True)
+    assert isinstance(build_conv_layer({'type': 'MyConv'}, **kwargs), MyConvA)
+    MODELS.register_module('MyConv', module=MyConvB, force=True)
+    assert isinstance(build_conv_layer({'type': 'MyConv'}, **kwargs), MyConvB)
+    MODELS.module_dict.pop('MyConv')
+
 
 def test_infer_norm_abbr():
     with pytest.raises(TypeError):
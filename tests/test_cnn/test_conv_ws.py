@@ -0,0 +1,83 @@
+# Copyright (c) OpenMMLab. All rights reserved.
+import pytest
+import torch
+import torch.nn.functional as F
+
+from mmcv.cnn.bricks import ConvAWS2d, ConvWS2d, conv_ws_2d
+
+
+def _ref_standardize(weight):
+    weight_flat = weight.view(weight.size(0), -1)
+    mean = weight_flat.mean(dim=1).view(-1, 1, 1, 1)
+    std = weight_flat.std(dim=1).view(-1, 1, 1, 1)
+    return (weight - mean) / (std + 1e-5)
+
+
+# 1x1 and 3x3 kernels with few input channels take the sum-based statistics
+# path, 72 elements per output channel take the std_mean path.
+@pytest.mark.parametrize('in_channels,kernel_size', [(8, 1), (3, 3), (8, 3)])
+def test_conv_ws_2d(in_channels, kernel_size):
+    x = torch.randn(2, in_channels, 8, 8)
+    weight = torch.randn(
+        4, in_channels, kernel_size, kernel_size, requires_grad=True)
+    bias = torch.randn(4)
+    padding = kernel_size // 2
+    out = conv_ws_2d(x, weight, bias, padding=padding)
+    assert out.shape == (2, 4, 8, 8)
+
+    expected = F.conv2d(
+        x, _ref_standardize(weight.detach()), bias, padding=padding)
+    assert torch.allclose(out, expected, atol=1e-5)
+
+    out.sum().backward()
+    assert weight.grad.shape == weight.shape
+
+
+def test_conv_ws_2d_offset_weight():
+    # the small-kernel statistics are computed around the mean and stay
+    # accurate when the weight is far from zero
+    weight = 100 + torch.randn(4, 8, 1, 1, dtype=torch.float64)
+    expected = _ref_standardize(weight)
+
+    x = torch.randn(2, 8, 5, 5)
+    out = conv_ws_2d(x, weight.float())
+    assert torch.allclose(
+        out, F.conv2d(x, expected.float()), rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize('conv_cls', [ConvWS2d, ConvAWS2d])
+def test_conv_ws_fuse_weights(conv_cls):
+    conv = conv_cls(3, 4, 3, padding=1)
+    x = torch.randn(2, 3, 8, 8)
+    expected = conv(x)
+
+    # without fusing, updates through ``.data`` are always picked up
+    conv.eval()
+    with torch.no_grad():
+        conv.weight.data.add_(torch.randn_like(conv.weight))
+        updated = conv(x)
+        assert not torch.allclose(updated, expected)
+        conv.weight.data = torch.randn_like(conv.weight)
+        assert not torch.allclose(conv(x), updated)
+        expected = conv(x)
+
+    conv.fuse_weights()
+    assert conv.weight_std is not None
+    assert 'weight_std' not in conv.state_dict()
+    assert torch.allclose(conv(x), expected, atol=1e-6)
+
+    conv.unfuse_weights()
+    assert conv.weight_std is None
+    assert torch.allclose(conv(x), expected, atol=1e-6)
+
+    # switching to train mode or loading weights drops the fused weight
+    conv.fuse_weights()
+    conv.train()
+    assert conv.weight_std is None
+
+    conv.eval()
+    conv.fuse_weights()
+    other = conv_cls(3, 4, 3, padding=1)
+    conv.load_state_dict(other.state_dict())
+    assert conv.weight_std is None
+    assert torch.allclose(conv(x), other(x), atol=1e-6)
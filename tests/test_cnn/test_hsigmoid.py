@@ -1,4 +1,7 @@
 # Copyright (c) OpenMMLab. All rights reserved.
+import inspect
+import io
+
 import pytest
 import torch
 from mmcv.cnn.bricks import HSigmoid
@@ -34,3 +37,43 @@ def test_hsigmoid():
     assert output.shape == expected_output.shape
     # test output value
     assert torch.equal(output, expected_output)
+
+    # test gradient with designated parameters
+    act = HSigmoid(1, 2, 0, 1)
+    input = torch.tensor([-3., -1., 0., 0.5, 1., 2.], requires_grad=True)
+    output = act(input)
+    assert torch.equal(output.detach(), ((input + 1) / 2).clamp(0, 1))
+    output.sum().backward()
+    expected_grad = torch.tensor([0., 0.5, 0.5, 0.5, 0.5, 0.])
+    assert torch.equal(input.grad, expected_grad)
+
+
+@pytest.mark.parametrize('args,node_types', [
+    ((), ['HardSigmoid']),
+    ((1, 2, 0, 1), ['HardSigmoid']),
+    ((1, 2, -1, 1),
+     ['Constant', 'Add', 'Constant', 'Div', 'Constant', 'Constant', 'Clip']),
+])
+def test_hsigmoid_onnx_export(args, node_types):
+    onnx = pytest.importorskip('onnx')
+    export_kwargs = {}
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs['dynamo'] = False
+
+    act = HSigmoid(*args)
+    input = torch.randn(1, 3, 4, 4) * 4
+    f = io.BytesIO()
+    torch.onnx.export(act, (input, ), f, opset_version=11, **export_kwargs)
+    model = onnx.load_from_string(f.getvalue())
+    onnx.checker.check_model(model)
+    assert [node.op_type for node in model.graph.node] == node_types
+
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        return
+    session = ort.InferenceSession(
+        f.getvalue(), providers=['CPUExecutionProvider'])
+    input_name = session.get_inputs()[0].name
+    output = session.run(None, {input_name: input.numpy()})[0]
+    assert torch.allclose(torch.from_numpy(output), act(input), atol=1e-6)
@@ -28,8 +28,10 @@ class TestBoxIoUQuadri:
                                 [2.0, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 1.0],
                                 [7.0, 6.0, 7.0, 8.0, 9.0, 8.0, 9.0, 6.0]],
                                dtype=np.float32)
+        # boxes1[0] and boxes2[1] both have an area of 6 and intersect over
+        # 5.25, the 1.0 expected here before was wrong.
         np_expect_ious = np.asarray(
-            [[0.0714, 1.0000, 0.0000], [0.0000, 0.5000, 0.0000],
+            [[0.0714, 0.7778, 0.0000], [0.0000, 0.5000, 0.0000],
              [0.0000, 0.0000, 0.5000]],
             dtype=np.float32)
         np_expect_ious_aligned = np.asarray([0.0714, 0.5000, 0.5000],
@@ -66,8 +68,10 @@ class TestBoxIoUQuadri:
                                 [2.0, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 1.0],
                                 [7.0, 6.0, 7.0, 8.0, 9.0, 8.0, 9.0, 6.0]],
                                dtype=np.float32)
+        # boxes1[0] and boxes2[1] both have an area of 6 and intersect over
+        # 5.25, the 1.0 expected here before was wrong.
         np_expect_ious = np.asarray(
-            [[0.1111, 1.0000, 0.0000], [0.0000, 1.0000, 0.0000],
+            [[0.1111, 0.8750, 0.0000], [0.0000, 1.0000, 0.0000],
              [0.0000, 0.0000, 1.0000]],
             dtype=np.float32)
         np_expect_ious_aligned = np.asarray([0.1111, 1.0000, 1.0000],
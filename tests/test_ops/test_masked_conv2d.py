@@ -12,6 +12,7 @@ if IS_MLU_AVAILABLE:
 class TestMaskedConv2d:
 
     @pytest.mark.parametrize('device', [
+        'cpu',
         pytest.param(
             'cuda',
             marks=pytest.mark.skipif(
@@ -42,3 +43,12 @@ class TestMaskedConv2d:
         conv.bias = torch.nn.Parameter(bias)
         output = conv(input, mask)
         assert np.allclose(output.data.cpu().numpy(), np_output, 1e-3)
+
+    def test_masked_conv2d_stride(self):
+        from mmcv.ops import MaskedConv2d
+        conv = MaskedConv2d(3, 3, 3, 2, 1)
+        input = torch.randn(1, 3, 8, 8)
+        # the unmasked path falls back to a strided Conv2d
+        assert conv(input).shape == (1, 3, 4, 4)
+        with pytest.raises(ValueError):
+            conv(input, torch.ones(1, 8, 8))
@@ -39,8 +39,6 @@ class Testnms:
         assert np.allclose(inds.cpu().numpy(), np_inds)  # test gpu
 
     def test_softnms_allclose(self):
-        if not torch.cuda.is_available():
-            return
         from mmcv.ops import soft_nms
         np_boxes = np.array([[6.0, 3.0, 8.0, 7.0], [3.0, 6.0, 9.0, 11.0],
                              [3.0, 7.0, 10.0, 12.0], [1.0, 4.0, 13.0, 7.0]],
@@ -93,7 +91,7 @@ class Testnms:
             assert np.allclose(dets.cpu().numpy(), np_output[m]['dets'])
             assert np.allclose(inds.cpu().numpy(), np_output[m]['inds'])
 
-        if torch.__version__ != 'parrots':
+        if torch.cuda.is_available():
             boxes = boxes.cuda()
             scores = scores.cuda()
             for iou, sig, mscore, m in configs:
@@ -107,9 +105,93 @@ class Testnms:
                 assert np.allclose(dets.cpu().numpy(), np_output[m]['dets'])
                 assert np.allclose(inds.cpu().numpy(), np_output[m]['inds'])
 
+    def test_nms_numba(self):
+        pytest.importorskip('numba')
+        from mmcv.ops import nms
+        rng = np.random.RandomState(0)
+        xy = rng.rand(200, 2).astype(np.float32) * 100
+        wh = rng.rand(200, 2).astype(np.float32) * 30
+        boxes = np.concatenate([xy, xy + wh], axis=1)
+        # Coarse scores so that ties are broken the same way.
+        scores = rng.randint(0, 10, 200).astype(np.float32) / 10
+
+        dets, inds = nms(boxes, scores, 0.3, score_threshold=0.2)
+        ref_dets, ref_inds = nms(
+            torch.from_numpy(boxes),
+            torch.from_numpy(scores),
+            0.3,
+            score_threshold=0.2)
+        assert isinstance(dets, np.ndarray)
+        assert np.array_equal(inds, ref_inds.numpy())
+        assert np.array_equal(dets, ref_dets.numpy())
+
+        # Integer boxes keep a fractional IoU threshold.
+        inds = nms(boxes.astype(np.int64), scores, 0.3)[1]
+        ref_inds = nms(
+            torch.from_numpy(boxes).long(), torch.from_numpy(scores), 0.3)[1]
+        assert np.array_equal(inds, ref_inds.numpy())
+
+    @pytest.mark.parametrize('method', [0, 1, 2])
+    def test_softnms_numba(self, method):
+        pytest.importorskip('numba')
+        from mmcv.ops.pure_pytorch_nms import soft_nms_numba, soft_nms_pytorch
+        rng = np.random.RandomState(0)
+        xy = rng.rand(200, 2).astype(np.float32) * 100
+        wh = rng.rand(200, 2).astype(np.float32) * 30
+        boxes = torch.from_numpy(np.concatenate([xy, xy + wh], axis=1))
+        scores = torch.from_numpy(rng.rand(200).astype(np.float32))
+
+        dets, inds = soft_nms_numba(boxes, scores, 0.3, 0.5, 1e-3, method)
+        ref_dets, ref_inds = soft_nms_pytorch(boxes, scores, 0.3, 0.5, 1e-3,
+                                              method)
+        assert torch.equal(inds, ref_inds)
+        assert torch.allclose(dets, ref_dets, atol=1e-6)
+
+    def test_nms_pytorch_greedy(self):
+        from mmcv.ops.pure_pytorch_nms import nms_pytorch
+
+        # A chain of boxes where each one only overlaps its neighbours, so
+        # that every other box is kept.
+        x1 = torch.arange(300, dtype=torch.float32) * 3
+        boxes = torch.stack(
+            [x1, torch.zeros(300), x1 + 10,
+             torch.full((300, ), 10.)], dim=1)
+        scores = torch.linspace(1, 0, 300)
+        inds = nms_pytorch(boxes, scores, 0.5)
+        assert torch.equal(inds, torch.arange(0, 300, 2))
+
+        # Integer boxes are compared in floating point.
+        inds = nms_pytorch(boxes.long(), scores, 0.5)
+        assert torch.equal(inds, torch.arange(0, 300, 2))
+
+    @pytest.mark.parametrize('num_boxes', [0, 1])
+    def test_nms_few_boxes(self, num_boxes):
+        from mmcv.ops import batched_nms, nms, nms_match, soft_nms
+        boxes = torch.tensor([[1.0, 2.0, 5.0, 7.0]])[:num_boxes]
+        scores = torch.tensor([0.4])[:num_boxes]
+        idxs = torch.zeros(num_boxes, dtype=torch.long)
+        expect_dets = torch.cat([boxes, scores[:, None]], dim=1)
+        expect_inds = torch.arange(num_boxes)
+
+        dets, inds = nms(boxes, scores, 0.5)
+        assert torch.equal(dets, expect_dets)
+        assert torch.equal(inds, expect_inds)
+        dets, inds = nms(boxes, scores, 0.5, score_threshold=0.5)
+        assert dets.shape == (0, 5) and inds.numel() == 0
+
+        dets, inds = soft_nms(boxes, scores, 0.5, min_score=0.5)
+        assert torch.equal(dets, expect_dets)
+        assert torch.equal(inds, expect_inds)
+
+        for nms_cfg in [dict(iou_threshold=0.5), None]:
+            dets, inds = batched_nms(boxes, scores, idxs, nms_cfg)
+            assert torch.equal(dets, expect_dets)
+            assert torch.equal(inds, expect_inds)
+
+        matched = nms_match(expect_dets, 0.5)
+        assert [m.tolist() for m in matched] == [[0]] * num_boxes
+
     def test_nms_match(self):
-        if not torch.cuda.is_available():
-            return
         from mmcv.ops import nms, nms_match
         iou_thr = 0.6
         # empty input
@@ -192,6 +274,55 @@ class Testnms:
         assert torch.equal(keep, seq_keep)
         assert torch.equal(boxes, seq_boxes)
 
+        # test `max_num` with nms, the value in `nms_cfg` takes precedence
+        for split_thr in (10000, 100):
+            nms_cfg = {
+                'type': 'soft_nms',
+                'iou_threshold': 0.7,
+                'split_thr': split_thr
+            }
+            topk_boxes, topk_keep = batched_nms(
+                torch.from_numpy(results['boxes']),
+                torch.from_numpy(results['scores']),
+                torch.from_numpy(results['idxs']),
+                nms_cfg,
+                class_agnostic=False,
+                max_num=10)
+            assert torch.equal(topk_keep, keep[:10])
+            assert torch.equal(topk_boxes, boxes[:10])
+
+            nms_cfg['max_num'] = 5
+            topk_boxes, topk_keep = batched_nms(
+                torch.from_numpy(results['boxes']),
+                torch.from_numpy(results['scores']),
+                torch.from_numpy(results['idxs']),
+                nms_cfg,
+                class_agnostic=False,
+                max_num=10)
+            assert torch.equal(topk_keep, keep[:5])
+            assert torch.equal(topk_boxes, boxes[:5])
+
+        # test the split path runs one nms per class, as the cost of nms
+        # grows with the square of the group size
+        from mmcv.ops import nms
+        group_sizes = []
+
+        def recording_nms(boxes, scores, **kwargs):
+            group_sizes.append(boxes.size(0))
+            return nms(boxes, scores, **kwargs)
+
+        idxs = torch.from_numpy(results['idxs'])
+        nms_cfg = {
+            'type': recording_nms,
+            'iou_threshold': 0.7,
+            'split_thr': 100
+        }
+        boxes, keep = batched_nms(
+            torch.from_numpy(results['boxes']),
+            torch.from_numpy(results['scores']), idxs, nms_cfg)
+        assert group_sizes == torch.unique(
+            idxs, return_counts=True)[1].tolist()
+
         # test skip nms when `nms_cfg` is None
         seq_boxes, seq_keep = batched_nms(
             torch.from_numpy(results['boxes']),
@@ -202,3 +333,14 @@ class Testnms:
         assert len(seq_keep) == len(results['boxes'])
         # assert score is descending order
         assert ((seq_boxes[:, -1][1:] - seq_boxes[:, -1][:-1]) < 0).all()
+
+        # test skip nms with `max_num`
+        topk_boxes, topk_keep = batched_nms(
+            torch.from_numpy(results['boxes']),
+            torch.from_numpy(results['scores']),
+            torch.from_numpy(results['idxs']),
+            None,
+            class_agnostic=False,
+            max_num=10)
+        assert torch.equal(topk_keep, seq_keep[:10])
+        assert torch.equal(topk_boxes, seq_boxes[:10])
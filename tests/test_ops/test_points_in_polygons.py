@@ -7,6 +7,7 @@ from mmcv.utils import IS_CUDA_AVAILABLE, IS_NPU_AVAILABLE
 
 
 @pytest.mark.parametrize('device', [
+    'cpu',
     pytest.param(
         'cuda',
         marks=pytest.mark.skipif(
@@ -141,3 +141,69 @@ def test_make_sparse_convmodule(device):
         assert isinstance(sparse_block1[2], SparseInverseConv3d)
         assert isinstance(sparse_block1[0], torch.nn.BatchNorm1d)
         assert isinstance(sparse_block1[1], torch.nn.ReLU)
+
+
+def _indice_conv_ref(features, filters, indice_pairs, indice_pair_num, num_out,
+                     inverse):
+    # gather-gemm-scatter sparse convolution differentiated by autograd
+    flat_filters = filters.reshape(-1, *filters.shape[-2:])
+    out = features.new_zeros(num_out, filters.shape[-1])
+    in_row = int(inverse)
+    for i, num_pairs in enumerate(indice_pair_num.tolist()):
+        in_inds = indice_pairs[i, in_row, :num_pairs].long()
+        out_inds = indice_pairs[i, 1 - in_row, :num_pairs].long()
+        out = out.index_add(0, out_inds, features[in_inds] @ flat_filters[i])
+    return out
+
+
+@pytest.mark.parametrize('inverse,subm', [(0, 0), (1, 0), (0, 1)])
+def test_indice_conv_backward_pytorch(inverse, subm):
+    from mmcv.ops.pure_pytorch_sparse_ops.indice_conv_backward import \
+        indice_conv_backward_pytorch
+
+    num_in, num_out = (6, 6) if subm else (6, 5)
+    kernel_volume = 27
+    features = torch.randn(num_in, 3, dtype=torch.float64)
+    filters = torch.randn(3, 3, 3, 3, 4, dtype=torch.float64)
+
+    num_a, num_b = (num_out, num_in) if inverse else (num_in, num_out)
+    indice_pairs = torch.full((kernel_volume, 2, num_in), -1).int()
+    indice_pair_num = torch.randint(0, num_a + 1, (kernel_volume, ))
+    for i, num_pairs in enumerate(indice_pair_num.tolist()):
+        indice_pairs[i, 0, :num_pairs] = torch.randperm(num_a)[:num_pairs]
+        indice_pairs[i, 1, :num_pairs] = torch.randint(num_b, (num_pairs, ))
+    if subm:
+        # the centre offset of a submanifold conv maps every input to itself
+        indice_pairs[kernel_volume // 2, :, :num_in] = torch.arange(num_in)
+        indice_pair_num[kernel_volume // 2] = num_in
+
+    out_bp = torch.randn(num_out, 4, dtype=torch.float64)
+    input_bp, filters_bp = indice_conv_backward_pytorch(
+        features, filters, out_bp, indice_pairs, indice_pair_num, inverse,
+        subm)
+
+    features.requires_grad_()
+    filters.requires_grad_()
+    out = _indice_conv_ref(features, filters, indice_pairs, indice_pair_num,
+                           num_out, inverse)
+    expected = torch.autograd.grad(out, (features, filters), out_bp)
+    assert torch.allclose(input_bp, expected[0])
+    assert torch.allclose(filters_bp, expected[1])
+
+    class IndiceConv(torch.autograd.Function):
+
+        @staticmethod
+        def forward(ctx, features, filters):
+            ctx.save_for_backward(features, filters)
+            return _indice_conv_ref(features, filters, indice_pairs,
+                                    indice_pair_num, num_out, inverse)
+
+        @staticmethod
+        def backward(ctx, out_bp):
+            features, filters = ctx.saved_tensors
+            return indice_conv_backward_pytorch(features, filters,
+                                                out_bp.contiguous(),
+                                                indice_pairs, indice_pair_num,
+                                                inverse, subm)
+
+    assert torch.autograd.gradcheck(IndiceConv.apply, (features, filters))
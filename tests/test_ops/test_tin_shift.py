@@ -201,6 +201,7 @@ def _test_tinshift_assert(device, dtype):
 
 
 @pytest.mark.parametrize('device', [
+    'cpu',
     pytest.param(
         'cuda',
         marks=pytest.mark.skipif(
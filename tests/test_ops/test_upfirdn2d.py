@@ -82,3 +82,36 @@ class TestUpFirDn2d:
         out2 = upfirdn2d(
             self.input_tensor.cuda(), filter=self.kernel.cuda(), gain=0.1)
         assert torch.allclose(out1, out2 * 2)
+
+    def test_upfirdn2d_pytorch(self):
+        from mmcv.ops.pure_pytorch_upfirdn2d.upfirdn2d import upfirdn2d_pytorch
+        from mmcv.ops.upfirdn2d import _upfirdn2d_ref
+
+        x = torch.randn(2, 3, 6, 5, dtype=torch.float64)
+        kernel = torch.randn(4, 3)
+        # (up, down, padding, flip_filter, gain)
+        cases = [
+            ((1, 1), (1, 1), (0, 0, 0, 0), False, 1),
+            ((2, 2), (1, 1), (2, 1, 2, 1), False, 1),
+            ((2, 3), (1, 1), (1, 2, 0, 3), True, 1),
+            ((1, 1), (2, 2), (1, 1, 1, 1), False, 0.5),
+            ((3, 2), (2, 3), (-1, 2, 1, -1), True, 2),
+        ]
+        for (upx, upy), (downx, downy), padding, flip_filter, gain in cases:
+            expected = _upfirdn2d_ref(
+                x,
+                kernel,
+                up=[upx, upy],
+                down=[downx, downy],
+                padding=list(padding),
+                flip_filter=flip_filter,
+                gain=gain)
+            out = upfirdn2d_pytorch(x, kernel, upx, upy, downx, downy,
+                                    *padding, flip_filter, gain)
+            assert out.shape == expected.shape
+            assert torch.allclose(out, expected)
+
+        x.requires_grad_()
+        gradcheck(
+            lambda x: upfirdn2d_pytorch(x, kernel, 2, 2, 2, 1, 1, 2, -1, 1,
+                                        False, 1), (x, ))
@@ -20,17 +20,31 @@ class AddToValue(BaseTransform):
     def add(self, results, addend):
         augend = results['value']
 
+        # Warn once per call, based on the top-level value only; the walk
+        # below never warns.
         if isinstance(augend, list):
             warnings.warn('value is a list', UserWarning, stacklevel=2)
-        if isinstance(augend, dict):
+        elif isinstance(augend, dict):
             warnings.warn('value is a dict', UserWarning, stacklevel=2)
 
         def _add_to_value(augend, addend):
-            if isinstance(augend, list):
-                return [_add_to_value(v, addend) for v in augend]
-            if isinstance(augend, dict):
-                return {k: _add_to_value(v, addend) for k, v in augend.items()}
-            return augend + addend
+            # Walk nested lists and dicts with an explicit stack. Every
+            # container is created with its final size and key order, and
+            # filled in when its children are popped.
+            root = [None]
+            stack = [(root, 0, augend)]
+            while stack:
+                parent, key, node = stack.pop()
+                if isinstance(node, list):
+                    out = [None] * len(node)
+                    stack.extend((out, i, v) for i, v in enumerate(node))
+                elif isinstance(node, dict):
+                    out = dict.fromkeys(node)
+                    stack.extend((out, k, v) for k, v in node.items())
+                else:
+                    out = node + addend
+                parent[key] = out
+            return root[0]
 
         results['value'] = _add_to_value(results['value'], addend)
         return results
@@ -72,7 +86,12 @@ class SumTwoValues(BaseTransform):
     """Dummy transform to test transform wrappers."""
 
     def transform(self, results):
-        if 'num_1' in results and 'num_2' in results:
+        if (isinstance(results.get('num_1'), (list, np.ndarray))
+                and isinstance(results.get('num_2'), (list, np.ndarray))):
+            # Element-wise sum rather than list concatenation.
+            results['sum'] = np.add(results['num_1'],
+                                    results['num_2']).tolist()
+        elif 'num_1' in results and 'num_2' in results:
             results['sum'] = results['num_1'] + results['num_2']
         elif 'num_1' in results:
             results['sum'] = results['num_1']
@@ -160,8 +179,8 @@ def test_key_mapper():
     results = {'value': 0}
     results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)  # should be unchanged
-    np.testing.assert_equal(results['v_out'], 1)
+    assert results['value'] == 0  # should be unchanged
+    assert results['v_out'] == 1
 
     # Case 1: simple remap
     pipeline = KeyMapper(
@@ -172,9 +191,9 @@ def test_key_mapper():
     results = {'value': 0, 'v_in': 1}
     results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)  # should be unchanged
-    np.testing.assert_equal(results['v_in'], 1)
-    np.testing.assert_equal(results['v_out'], 2)
+    assert results['value'] == 0  # should be unchanged
+    assert results['v_in'] == 1
+    assert results['v_out'] == 2
 
     # Case 2: collecting list
     pipeline = KeyMapper(
@@ -186,11 +205,11 @@ def test_key_mapper():
     with pytest.warns(UserWarning, match='value is a list'):
         results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)  # should be unchanged
-    np.testing.assert_equal(results['v_in_1'], 1)
-    np.testing.assert_equal(results['v_in_2'], 2)
-    np.testing.assert_equal(results['v_out_1'], 3)
-    np.testing.assert_equal(results['v_out_2'], 4)
+    assert results['value'] == 0  # should be unchanged
+    assert results['v_in_1'] == 1
+    assert results['v_in_2'] == 2
+    assert results['v_out_1'] == 3
+    assert results['v_out_2'] == 4
 
     # Case 3: collecting dict
     pipeline = KeyMapper(
@@ -208,11 +227,11 @@ def test_key_mapper():
     with pytest.warns(UserWarning, match='value is a dict'):
         results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)  # should be unchanged
-    np.testing.assert_equal(results['v_in_1'], 1)
-    np.testing.assert_equal(results['v_in_2'], 2)
-    np.testing.assert_equal(results['v_out_1'], 3)
-    np.testing.assert_equal(results['v_out_2'], 4)
+    assert results['value'] == 0  # should be unchanged
+    assert results['v_in_1'] == 1
+    assert results['v_in_2'] == 2
+    assert results['v_out_1'] == 3
+    assert results['v_out_2'] == 4
 
     # Case 4: collecting list with auto_remap mode
     pipeline = KeyMapper(
@@ -224,9 +243,9 @@ def test_key_mapper():
     with pytest.warns(UserWarning, match='value is a list'):
         results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)
-    np.testing.assert_equal(results['v_in_1'], 3)
-    np.testing.assert_equal(results['v_in_2'], 4)
+    assert results['value'] == 0
+    assert results['v_in_1'] == 3
+    assert results['v_in_2'] == 4
 
     # Case 5: collecting dict with auto_remap mode
     pipeline = KeyMapper(
@@ -238,9 +257,9 @@ def test_key_mapper():
     with pytest.warns(UserWarning, match='value is a dict'):
         results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)
-    np.testing.assert_equal(results['v_in_1'], 3)
-    np.testing.assert_equal(results['v_in_2'], 4)
+    assert results['value'] == 0
+    assert results['v_in_1'] == 3
+    assert results['v_in_2'] == 4
 
     # Case 6: nested collection with auto_remap mode
     pipeline = KeyMapper(
@@ -252,11 +271,11 @@ def test_key_mapper():
     with pytest.warns(UserWarning, match='value is a list'):
         results = pipeline(results)
 
-    np.testing.assert_equal(results['value'], 0)
-    np.testing.assert_equal(results['v1'], 3)
-    np.testing.assert_equal(results['v21'], 4)
-    np.testing.assert_equal(results['v22'], 5)
-    np.testing.assert_equal(results['v3'], 6)
+    assert results['value'] == 0
+    assert results['v1'] == 3
+    assert results['v21'] == 4
+    assert results['v22'] == 5
+    assert results['v3'] == 6
 
     # Case 7: output_map must be None if `auto_remap` is set True
     with pytest.raises(ValueError):
@@ -274,10 +293,10 @@ def test_key_mapper():
         allow_nonexist_keys=True)
 
     results = pipeline({'a': 1, 'b': 2})
-    np.testing.assert_equal(results['sum'], 3)
+    assert results['sum'] == 3
 
     results = pipeline({'a': 1})
-    np.testing.assert_equal(results['sum'], 1)
+    assert results['sum'] == 1
 
     # Case 9: use wrapper as a transform
     transform = KeyMapper(mapping={'b': 'a'}, auto_remap=False)
@@ -294,7 +313,7 @@ def test_key_mapper():
         allow_nonexist_keys=False)
 
     results = pipeline({'a': 1, 'b': 2})
-    np.testing.assert_equal(results['sum'], 1)
+    assert results['sum'] == 1
 
     # Test basic functions
     pipeline = KeyMapper(
@@ -336,8 +355,8 @@ def test_transform_broadcaster():
 
     results = pipeline(results)
 
-    np.testing.assert_equal(results['v_1'], 2)
-    np.testing.assert_equal(results['v_2'], 3)
+    assert results['v_1'] == 2
+    assert results['v_2'] == 3
 
     # Case 3: apply to multiple groups of keys
     pipeline = TransformBroadcaster(
@@ -349,8 +368,8 @@ def test_transform_broadcaster():
     results = {'a_1': 1, 'a_2': 2, 'b_1': 3, 'b_2': 4}
     results = pipeline(results)
 
-    np.testing.assert_equal(results['a'], 3)
-    np.testing.assert_equal(results['b'], 7)
+    assert results['a'] == 3
+    assert results['b'] == 7
 
     # Case 3: apply to all keys
     pipeline = TransformBroadcaster(
@@ -381,7 +400,7 @@ def test_transform_broadcaster():
     results = {'values': [0, 0]}
     results = pipeline(results)
 
-    np.testing.assert_equal(results['values'][0], results['values'][1])
+    assert results['values'][0] == results['values'][1]
 
     # Case 6: partial broadcasting
     pipeline = TransformBroadcaster(
@@ -393,8 +412,8 @@ def test_transform_broadcaster():
     results = {'a_1': 1, 'a_2': 2, 'b_1': 3, 'b_2': 4}
     results = pipeline(results)
 
-    np.testing.assert_equal(results['a'], 3)
-    np.testing.assert_equal(results['b'], 3)
+    assert results['a'] == 3
+    assert results['b'] == 3
 
     pipeline = TransformBroadcaster(
         transforms=[SumTwoValues()],
@@ -405,7 +424,7 @@ def test_transform_broadcaster():
     results = {'a_1': 1, 'a_2': 2, 'b_1': 3, 'b_2': 4}
     results = pipeline(results)
 
-    np.testing.assert_equal(results['a'], 3)
+    assert results['a'] == 3
     assert 'b' not in results
 
     # Test repr
@@ -425,7 +444,7 @@ def test_random_choice():
         prob=[1.0, 0.0])
 
     results = pipeline({'value': 1})
-    np.testing.assert_equal(results['value'], 2.0)
+    assert results['value'] == 2.0
 
     # Case 2: default probability
     pipeline = RandomChoice(transforms=[[AddToValue(
@@ -466,11 +485,11 @@ def test_random_apply():
     # Case 1: simple use
     pipeline = RandomApply(transforms=[AddToValue(addend=1.0)], prob=1.0)
     results = pipeline({'value': 1})
-    np.testing.assert_equal(results['value'], 2.0)
+    assert results['value'] == 2.0
 
     pipeline = RandomApply(transforms=[AddToValue(addend=1.0)], prob=0.0)
     results = pipeline({'value': 1})
-    np.testing.assert_equal(results['value'], 1.0)
+    assert results['value'] == 1.0
 
     # Case 2: nested RandomApply in TransformBroadcaster
     pipeline = TransformBroadcaster(